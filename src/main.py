@@ -5,19 +5,57 @@ Main application file for converting WAV files to MP4 videos with waveform visua
 """
 
 import os
+import re
 import sys
 import json
+import io
 import hashlib
-import pickle
-from pathlib import Path
+import shlex
+import shutil
+import subprocess
 import tempfile
+from collections import defaultdict
+from contextlib import redirect_stdout
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+try:
+    # Optional faster JSON parser for episode_titles.json
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
 
-from audio_processor import AudioProcessor
-from waveform_visualizer import WaveformVisualizer
-from video_generator import VideoGenerator
+# Runs of two or more spaces, collapsed when generating titles
+_MULTISPACE_RE = re.compile(r' {2,}')
+
+# Interactive file selection: comma-separated file numbers or ranges, e.g. "1, 3-5,8"
+_SELECTION_RE = re.compile(r'\s*\d+(?:\s*-\s*\d+)?(?:\s*,\s*\d+(?:\s*-\s*\d+)?)*\s*')
+_SELECTION_ITEM_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+
+def parse_selection(selection, count):
+    """Expand a file selection such as "1,3-5" into 0-based indices of count files.
+    
+    Files are kept in the order given and only once. A reversed range ("5-3") selects
+    the same files as "3-5", and numbers outside 1..count are ignored.
+    
+    Returns:
+        List of indices, or None if the selection isn't numbers and ranges separated by commas
+    """
+    if not _SELECTION_RE.fullmatch(selection):
+        return None
+    indices = {}
+    for match in _SELECTION_ITEM_RE.finditer(selection):
+        first = int(match.group(1))
+        last = int(match.group(2) or first)
+        if last < first:
+            first, last = last, first
+        indices.update(dict.fromkeys(range(max(first, 1) - 1, min(last, count))))
+    return list(indices)
 
 
 class PodcastVideoConverter:
@@ -25,13 +63,39 @@ class PodcastVideoConverter:
     
     # Supported audio formats
     SUPPORTED_AUDIO_FORMATS = {'.wav', '.mp3', '.flac', '.m4a', '.aac', '.ogg', '.wma'}
+    _AUDIO_EXTENSIONS = frozenset(ext[1:] for ext in SUPPORTED_AUDIO_FORMATS)
+    
+    # Header signatures of formats decoded directly rather than via FFmpeg:
+    # (offset, accepted bytes) pairs that must all match
+    _AUDIO_SIGNATURES = {
+        'wav': ((0, (b'RIFF', b'RF64', b'BW64')), (8, (b'WAVE',))),
+        'flac': ((0, (b'fLaC',)),),
+    }
+    
+    # Supported episode image formats, in order of preference
+    EPISODE_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp')
+    
+    # Replacements for characters that are invalid in Windows filenames: < > : " | ? * \ /
+    _SANITIZE_TABLE = str.maketrans({
+        ':': ' -', '<': '', '>': '', '"': "'", '|': '-', '?': '', '*': '', '\\': '-', '/': '-'
+    })
     
-    def __init__(self, enhance_audio=False):
+    def __init__(self, enhance_audio=False, jobs=1, verbose=False, force=False, encoder='libx264', preset=None,
+                 dedup=True, edit_titles=False):
         """Initialize the podcast video converter.
         
         Args:
             enhance_audio: If True, apply audio enhancement (EQ, normalization, click removal).
                           If False (default), only load audio and add intro/outro music.
+            jobs: Number of files to process in parallel worker processes (default 1).
+                  0 picks half the CPU cores, leaving headroom for FFmpeg's own threads.
+            verbose: If True, report output file sizes after each conversion.
+            force: If True, re-process files even if their video is up to date.
+            encoder: H.264 encoder for FFmpeg, or 'auto' to use a working hardware encoder if any.
+            preset: Encoder speed/quality preset, for encoders that have presets (default: the encoder's own).
+            dedup: If True, render identical input files (same audio, title and image) only once.
+            edit_titles: If True, edit all episode titles in one text editor session instead of
+                         one prompt per file (interactive mode).
         """
         self.base_dir = Path(__file__).parent.parent
         
@@ -42,17 +106,65 @@ class PodcastVideoConverter:
         self.logo_path = self.assets_dir / "podcast_logo.jpeg"
         self.episode_titles_file = self.base_dir / "episode_titles.json"
         self.enhance_audio = enhance_audio
+        self.jobs = max(1, jobs if jobs > 0 else (os.cpu_count() or 2) // 2)
+        self.verbose = verbose
+        self.force = force
+        self.encoder = encoder
+        self.preset = preset
+        # Whether self.encoder has been resolved ('auto') and checked (see resolve_encoder)
+        self._encoder_resolved = False
+        self.dedup = dedup
+        self.edit_titles = edit_titles
+        # Input size (MB) above which a memory warning is printed
+        try:
+            self.large_file_mb = float(os.environ.get('PODCAST_LARGE_MB', 100))
+        except ValueError:
+            print(f"⚠️  Ignoring PODCAST_LARGE_MB={os.environ['PODCAST_LARGE_MB']!r} (not a number), using 100 MB")
+            self.large_file_mb = 100.0
         
-        # Initialize components
-        self.audio_processor = AudioProcessor()
-        self.waveform_visualizer = WaveformVisualizer()
-        self.video_generator = VideoGenerator()
+        # Processing components are created on first use (see _init_components) so
+        # runs that find nothing to do exit without importing the heavy libraries
+        self.audio_processor = None
+        self.waveform_visualizer = None
+        self.video_generator = None
         
         # Ensure directories exist
         self.ensure_directories()
         
-        # Episode titles (no caching)
-        self.episode_titles = {}
+        # Episode titles saved by previous runs (loaded once, saved after titles are set up)
+        self.episode_titles = self.load_episode_titles()
+        
+        # Input file stat results recorded by the last directory scan
+        self.file_stats = {}
+        
+        # Episode images per input directory, keyed by file stem
+        self._episode_image_index = {}
+    
+    def _init_components(self):
+        """Import and create the audio, waveform and video components if not done yet."""
+        if self.audio_processor is not None:
+            return
+        from audio_processor import AudioProcessor
+        from waveform_visualizer import WaveformVisualizer
+        from video_generator import VideoGenerator
+        
+        self.audio_processor = AudioProcessor()
+        self.waveform_visualizer = WaveformVisualizer()
+        self.video_generator = VideoGenerator()
+        self.video_generator.encoder = self.resolve_encoder()
+        self.video_generator.preset = self.preset
+    
+    def resolve_encoder(self):
+        """Resolve 'auto' to a concrete encoder and check it works, once per run.
+        
+        Parallel runs do this in the parent process, so the workers don't each repeat
+        the FFmpeg test encodes.
+        """
+        if not self._encoder_resolved:
+            from video_generator import VideoGenerator
+            self.encoder = VideoGenerator.select_encoder(self.encoder, self.preset)
+            self._encoder_resolved = True
+        return self.encoder
     
     def ensure_directories(self):
         """Create necessary directories if they don't exist."""
@@ -61,33 +173,72 @@ class PodcastVideoConverter:
     
     def load_episode_titles(self):
         """Load episode titles from JSON file."""
+        # Raw file contents, kept so unchanged titles aren't rewritten on save
+        self._titles_raw = None
         if self.episode_titles_file.exists():
             try:
-                with open(self.episode_titles_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # Parse the raw UTF-8 bytes directly (no separate text decode)
+                data = self.episode_titles_file.read_bytes()
+                titles = orjson.loads(data) if orjson else json.loads(data)
+                self._titles_raw = data
+                return titles
             except Exception as e:
                 print(f"Warning: Could not load episode titles: {e}")
         return {}
     
     def save_episode_titles(self):
-        """Save episode titles to JSON file."""
+        """Save episode titles to JSON file (skipped if the contents would be unchanged)."""
+        if orjson:
+            data = orjson.dumps(self.episode_titles, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.episode_titles, indent=2, ensure_ascii=False).encode('utf-8')
+        if data == self._titles_raw:
+            return
+        
+        # Write to a temporary file and rename it over the original, so an
+        # interrupted save can't leave a truncated titles file behind
+        tmp_path = self.episode_titles_file.with_name(self.episode_titles_file.name + ".tmp")
         try:
-            with open(self.episode_titles_file, 'w', encoding='utf-8') as f:
-                json.dump(self.episode_titles, f, indent=2, ensure_ascii=False)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.episode_titles_file)
+            self._titles_raw = data
         except Exception as e:
             print(f"Warning: Could not save episode titles: {e}")
     
     def get_audio_files(self):
-        """Get list of supported audio files in the input directory."""
+        """Get list of supported audio files in the input directory.
+        
+        Stat results are recorded in self.file_stats during the same scan so the
+        files don't need to be stat'ed again later.
+        """
         # Use case-insensitive search to avoid duplicates
         audio_files = []
-        for file_path in self.input_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_AUDIO_FORMATS:
-                audio_files.append(file_path)
+        self.file_stats = {}
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                # Check the extension first so rejected entries cost a single split
+                stem, _, ext = entry.name.rpartition('.')
+                if stem and ext.lower() in self._AUDIO_EXTENSIONS and entry.is_file():
+                    file_path = Path(entry.path)
+                    audio_files.append(file_path)
+                    self.file_stats[file_path] = entry.stat()
         return sorted(audio_files)
     
-    def generate_title_from_filename(self, filename):
-        """Generate a clean title from a filename.
+    def get_file_stat(self, file_path):
+        """Get a file's stat result, reusing the one recorded by get_audio_files if available."""
+        stat = self.file_stats.get(file_path)
+        if stat is None:
+            stat = self.file_stats[file_path] = file_path.stat()
+        return stat
+    
+    def get_file_size(self, file_path):
+        """Get a file's size in bytes."""
+        return self.get_file_stat(file_path).st_size
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def generate_title_from_filename(filename):
+        """Generate a clean title from a filename (memoized, as it is a pure function).
         
         Args:
             filename: The file stem (without extension)
@@ -95,45 +246,101 @@ class PodcastVideoConverter:
         Returns:
             A cleaned title string
         """
-        import re
         clean_filename = filename
-        if clean_filename.lower().startswith('episode: '):
+        # Only the prefix needs case-folding, not the whole name
+        if clean_filename[:9].lower() == 'episode: ':
             clean_filename = clean_filename[9:]
         
         # Replace underscore with colon
         clean_filename = clean_filename.replace('_', ':')
         # Normalize any multiple spaces to single space
-        clean_filename = re.sub(r'  +', ' ', clean_filename)
+        clean_filename = _MULTISPACE_RE.sub(' ', clean_filename)
         return clean_filename
     
+    def _build_suggestions(self, selected_files):
+        """Map each selected file stem to its suggested title.
+        
+        Titles saved by a previous run are preferred; otherwise one is generated
+        from the filename.
+        """
+        return {
+            path.stem: self.episode_titles.get(path.stem) or self.generate_title_from_filename(path.stem)
+            for path in selected_files
+        }
+    
     def collect_all_episode_titles(self, selected_files):
         """Collect episode titles for all selected files upfront."""
-        print(f"\n📝 Setting up episode titles for {len(selected_files)} file(s)")
+        # Work out every suggestion before the first prompt
+        suggestions = self._build_suggestions(selected_files)
+        n = len(suggestions)
+        width = len(str(n))
+        
+        print(f"\n📝 Setting up episode titles for {n} file(s)")
         print("=" * 60)
-        print("Please provide episode titles for each file. You can:")
-        print("  • Press Enter to use the auto-generated title")
-        print("  • Type a custom title and press Enter")
-        print()
         
-        for i, wav_file_path in enumerate(selected_files, 1):
-            filename = wav_file_path.stem
-            
-            # Generate suggested title
-            suggested_title = self.generate_title_from_filename(filename)
-            
+        # Edit every title at once in a text editor if requested (falls back to prompts)
+        if self.edit_titles:
+            edited = self.edit_titles_in_editor(suggestions)
+            if edited is not None:
+                self.episode_titles.update(edited)
+                sys.stdout.write("".join(f"   ✓ {filename}: '{title}'\n" for filename, title in edited.items()))
+                print("✅ All episode titles collected!")
+                return True
+        
+        sys.stdout.write(
+            "Please provide episode titles for each file. You can:\n"
+            "  • Press Enter to use the auto-generated title\n"
+            "  • Type a custom title and press Enter\n\n"
+        )
+        
+        titles = self.episode_titles
+        for i, (filename, suggested_title) in enumerate(suggestions.items(), 1):
             # Prompt for title
-            print(f"[{i}/{len(selected_files)}] {filename}")
-            print(f"   Suggested: '{suggested_title}'")
+            sys.stdout.write(f"[{i:>{width}}/{n}] {filename}\n   Suggested: '{suggested_title}'\n")
             user_title = input("   Enter title (or press Enter for suggested): ").strip()
             
             episode_title = user_title if user_title else suggested_title
-            self.episode_titles[filename] = episode_title
-            print(f"   ✓ Set title: '{episode_title}'")
-            print()
+            titles[filename] = episode_title
+            print(f"   ✓ Set title: '{episode_title}'\n")
         
         print("✅ All episode titles collected!")
         return True
     
+    def edit_titles_in_editor(self, suggestions):
+        """Let the user edit all suggested titles in one text editor session.
+        
+        Uses $VISUAL or $EDITOR (nano, or notepad on Windows, by default).
+        
+        Returns:
+            Dict of filename -> title, or None if the editor failed or the
+            number of titles no longer matches the files
+        """
+        editor = os.environ.get('VISUAL') or os.environ.get('EDITOR') or ('notepad' if os.name == 'nt' else 'nano')
+        lines = [
+            "# One episode title per line, in the order of the files below.",
+            "# Lines starting with '#' and blank lines are ignored.",
+        ]
+        for filename, suggested_title in suggestions.items():
+            lines += [f"# {filename}", suggested_title]
+        
+        # Closed before the editor opens it (Windows can't share an open temp file)
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8', delete=False) as f:
+            f.write("\n".join(lines) + "\n")
+        try:
+            subprocess.run([*shlex.split(editor, posix=os.name != 'nt'), f.name], check=True)
+            with open(f.name, encoding='utf-8') as edited:
+                titles = [line.strip() for line in edited if line.strip() and not line.lstrip().startswith('#')]
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"⚠ Could not edit titles with '{editor}': {e}")
+            return None
+        finally:
+            os.remove(f.name)
+        
+        if len(titles) != len(suggestions):
+            print(f"⚠ Expected {len(suggestions)} titles but found {len(titles)}; asking for each file instead.")
+            return None
+        return dict(zip(suggestions, titles))
+    
     def select_files_to_process(self, audio_files):
         """Interactive file selection from available audio files."""
         if not audio_files:
@@ -141,22 +348,24 @@ class PodcastVideoConverter:
             print(f"Please place your audio files (.wav, .mp3, .flac, etc.) in: {self.input_dir}")
             return []
         
-        print(f"\n📁 Found {len(audio_files)} audio file(s) in input directory:")
-        print("-" * 60)
-        
+        # Emit the whole listing with a single write
+        lines = [f"\n📁 Found {len(audio_files)} audio file(s) in input directory:", "-" * 60]
         for i, audio_file in enumerate(audio_files, 1):
-            size_mb = audio_file.stat().st_size / (1024 * 1024)
-            print(f"{i:2d}. {audio_file.name} ({size_mb:.1f} MB)")
-        
-        print("\n🎯 Selection options:")
-        print("  • Enter numbers (e.g., 1,3,5): Process specific files")
-        print("  • Enter 'all': Process all files")
-        print("  • Enter 'q': Quit")
+            size_mb = self.get_file_size(audio_file) / (1024 * 1024)
+            lines.append(f"{i:2d}. {audio_file.name} ({size_mb:.1f} MB)")
+        lines += [
+            "\n🎯 Selection options:",
+            "  • Enter numbers or ranges (e.g., 1,3,5 or 2-6,9): Process specific files",
+            "  • Enter 'all': Process all files",
+            "  • Enter 'q': Quit",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
         
         while True:
             try:
                 selection = input("\nYour choice: ").strip().lower()
-                print(f"[DEBUG] You entered: '{selection}'")  # Debug output
+                if os.environ.get('PODCAST_DEBUG'):
+                    print(f"[DEBUG] You entered: '{selection}'")  # Debug output
                 
                 if selection == 'q':
                     print("Quitting...")
@@ -164,19 +373,15 @@ class PodcastVideoConverter:
                 elif selection == 'all':
                     print("✓ Selected all files")
                     return audio_files
+                
+                indices = parse_selection(selection, len(audio_files))
+                if indices is None:
+                    print("❌ Invalid format. Please enter numbers or ranges separated by commas (e.g., 1,3-5).")
+                elif indices:
+                    print(f"✓ Selected {len(indices)} file(s)")
+                    return [audio_files[i] for i in indices]
                 else:
-                    try:
-                        # Parse comma-separated numbers
-                        indices = [int(x.strip()) - 1 for x in selection.split(',')]
-                        selected_files = [audio_files[i] for i in indices if 0 <= i < len(audio_files)]
-                        
-                        if selected_files:
-                            print(f"✓ Selected {len(selected_files)} file(s)")
-                            return selected_files
-                        else:
-                            print("❌ Invalid selection. Please try again.")
-                    except (ValueError, IndexError):
-                        print("❌ Invalid format. Please enter numbers separated by commas (e.g., 1,3,5).")
+                    print("❌ Invalid selection. Please try again.")
             except KeyboardInterrupt:
                 print("\n\n👋 Process interrupted by user.")
                 return []
@@ -184,10 +389,21 @@ class PodcastVideoConverter:
                 print("\n❌ Input error occurred.")
                 return []
     
+    def find_logo_files(self):
+        """Find files named exactly 'podcast_logo' with any extension."""
+        # One directory listing catches every extension, so duplicate logos are always detected
+        # (variants like 'podcast_logo_with_signal.png' don't match)
+        logo_files = []
+        with os.scandir(self.assets_dir) as entries:
+            for entry in entries:
+                stem, dot, _ = entry.name.rpartition('.')
+                if dot and stem == "podcast_logo" and entry.is_file():
+                    logo_files.append(Path(entry.path))
+        return sorted(logo_files)
+    
     def check_logo_file(self):
         """Check if logo file exists and validate there's only one logo file."""
-        # Find files named exactly 'podcast_logo' with any extension (exclude variants like 'podcast_logo_with_signal')
-        logo_files = [f for f in self.assets_dir.glob("podcast_logo.*") if f.stem == "podcast_logo"]
+        logo_files = self.find_logo_files()
         
         if len(logo_files) == 0:
             print("❌ Logo file not found!")
@@ -215,54 +431,134 @@ class PodcastVideoConverter:
     
     def get_episode_image_path(self, audio_file_path):
         """Check for an optional episode-specific image matching the audio filename."""
-        # Supported image formats
-        image_extensions = ['.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp']
-        
-        # Look in the same directory as the audio file
-        base_name = audio_file_path.stem
+        # Look in the same directory as the audio file, listing each directory only once
         audio_dir = audio_file_path.parent
-        
-        for ext in image_extensions:
-            potential_image = audio_dir / f"{base_name}{ext}"
-            if potential_image.exists():
-                return potential_image
-        
-        return None
+        images = self._episode_image_index.get(audio_dir)
+        if images is None:
+            images = self._episode_image_index[audio_dir] = self._index_episode_images(audio_dir)
+        return images.get(audio_file_path.stem)
+    
+    def _index_episode_images(self, directory):
+        """Map file stems to image paths in a directory, keeping the preferred format per stem."""
+        images = {}
+        ranks = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    ext = ext.lower()
+                    if ext not in self.EPISODE_IMAGE_EXTENSIONS or not entry.is_file():
+                        continue
+                    rank = self.EPISODE_IMAGE_EXTENSIONS.index(ext)
+                    if rank < ranks.get(stem, len(self.EPISODE_IMAGE_EXTENSIONS)):
+                        images[stem] = Path(entry.path)
+                        ranks[stem] = rank
+        except OSError:
+            pass
+        return images
     
     def get_episode_title(self, wav_file_path):
         """Get episode title for a file (should already be collected)."""
         filename = wav_file_path.stem
         return self.episode_titles.get(filename, filename)  # Fallback to filename if not found
     
-    def process_single_file(self, wav_file_path):
-        """Process a single WAV file to MP4."""
-        filename = wav_file_path.stem
-        
-        # Sanitize filename for Windows compatibility
-        # Remove or replace invalid characters: < > : " | ? * \
-        sanitized_filename = filename.replace(':', ' -').replace('<', '').replace('>', '').replace('"', "'").replace('|', '-').replace('?', '').replace('*', '').replace('\\', '-').replace('/', '-')
+    @staticmethod
+    def _file_signature(path):
+        """Cheap change detector for an optional input file: [mtime, size], or None if absent."""
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        return [stat.st_mtime, stat.st_size]
+    
+    def build_stamp(self, wav_file_path, episode_title):
+        """Describe the inputs a video was rendered from, for up-to-date checks."""
+        stat = self.get_file_stat(wav_file_path)
+        episode_image_path = self.get_episode_image_path(wav_file_path)
+        return {
+            'src_mtime': stat.st_mtime,
+            'src_size': stat.st_size,
+            'enhance_audio': self.enhance_audio,
+            'episode_title': episode_title,
+            # Images are drawn into the video, so replacing them also invalidates it
+            'logo': self._file_signature(self.logo_path),
+            'episode_image': episode_image_path and [episode_image_path.name, self._file_signature(episode_image_path)],
+            # So are the encoder settings ('auto' is recorded as the encoder it picks)
+            'encoder': self.resolve_encoder() if self.encoder == 'auto' else self.encoder,
+            'preset': self.preset
+        }
+    
+    def get_stamp_path(self, output_path):
+        """Get the sidecar file recording what an output video was rendered from."""
+        return output_path.with_name(output_path.name + ".stamp")
+    
+    def is_up_to_date(self, output_path, processed_audio_path, stamp):
+        """Check whether an output video and its processed audio exist and were made from the same inputs."""
+        stamp_path = self.get_stamp_path(output_path)
+        if not (output_path.exists() and processed_audio_path.exists() and stamp_path.exists()):
+            return False
+        try:
+            data = stamp_path.read_bytes()
+            return (orjson.loads(data) if orjson else json.loads(data)) == stamp
+        except Exception:
+            return False
+    
+    def save_stamp(self, output_path, stamp):
+        """Record the inputs of a freshly rendered video next to it."""
+        try:
+            stamp_path = self.get_stamp_path(output_path)
+            if orjson:
+                stamp_path.write_bytes(orjson.dumps(stamp))
+            else:
+                stamp_path.write_text(json.dumps(stamp), encoding='utf-8')
+        except Exception as e:
+            print(f"Warning: Could not save stamp for {output_path.name}: {e}")
+    
+    def get_output_paths(self, wav_file_path):
+        """Get the (video, processed audio) output paths for an input file."""
+        # Sanitize filename for Windows compatibility (single pass over the name)
+        sanitized_filename = wav_file_path.stem.translate(self._SANITIZE_TABLE)
         
         output_path = self.output_dir / f"{sanitized_filename}.mp4"
         # Name the audio file based on whether enhancement is enabled
         audio_suffix = "_enhanced" if self.enhance_audio else "_processed"
         processed_audio_path = self.output_dir / f"{sanitized_filename}{audio_suffix}.wav"
+        return output_path, processed_audio_path
+    
+    def process_single_file(self, wav_file_path):
+        """Process a single WAV file to MP4."""
+        output_path, processed_audio_path = self.get_output_paths(wav_file_path)
         
-        print(f"\n🚀 Processing: {wav_file_path.name}")
-        print("=" * 80)
+        # Collect multi-line messages and emit each block with a single write
+        log_lines = [f"\n🚀 Processing: {wav_file_path.name}", "=" * 80]
         
         # Check file size and warn about memory usage
-        file_size_mb = wav_file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > 100:  # Large file warning
-            print(f"⚠️  Large file detected ({file_size_mb:.1f} MB)")
-            print("   This may require significant memory. Consider:")
-            print("   • Closing other applications")
-            print("   • Using a shorter audio file for testing")
-            print("   • Ensuring you have at least 4GB free RAM")
+        file_size_mb = self.get_file_size(wav_file_path) / (1024 * 1024)
+        if file_size_mb > self.large_file_mb:  # Large file warning
+            log_lines += [
+                f"⚠️  Large file detected ({file_size_mb:.1f} MB)",
+                "   This may require significant memory. Consider:",
+                "   • Closing other applications",
+                "   • Using a shorter audio file for testing",
+                "   • Ensuring you have at least 4GB free RAM",
+            ]
         
         try:
             # Get episode title
             episode_title = self.get_episode_title(wav_file_path)
-            print(f"📝 Episode title: {episode_title}")
+            
+            # Skip files whose video was already rendered from the same audio and settings
+            stamp = self.build_stamp(wav_file_path, episode_title)
+            if not self.force and self.is_up_to_date(output_path, processed_audio_path, stamp):
+                log_lines.append(f"⏭️  Up to date, skipping: {output_path.name} (use --force to re-process)")
+                sys.stdout.write("\n".join(log_lines) + "\n")
+                sys.stdout.flush()
+                return True
+            
+            log_lines.append(f"📝 Episode title: {episode_title}")
+            sys.stdout.write("\n".join(log_lines) + "\n")
+            
+            self._init_components()
             
             # Step 1: Process and save audio (with or without enhancement)
             audio_type = "enhanced" if self.enhance_audio else "processed"
@@ -279,8 +575,9 @@ class PodcastVideoConverter:
             duration = self.audio_processor.get_audio_duration(processed_audio, sample_rate)
             print(f"⏱️  Audio duration: {duration:.2f} seconds")
             
+            # The saved file keys the cache; the samples already in memory skip decoding it again
             waveform_frame_generator = self.waveform_visualizer.generate_waveform_frames(
-                str(processed_audio_path), duration  # Pass file path for caching support
+                str(processed_audio_path), duration, processed_audio, sample_rate
             )
             
             # Step 3: Create final video
@@ -304,23 +601,208 @@ class PodcastVideoConverter:
             # No need to clean up temporary file since we saved the audio permanently
             
             if success:
-                print(f"✅ Successfully created: {output_path.name}")
-                print(f"✅ {audio_type.capitalize()} audio saved: {processed_audio_path.name}")
-                video_size_mb = output_path.stat().st_size / (1024 * 1024)
-                audio_size_mb = processed_audio_path.stat().st_size / (1024 * 1024)
-                print(f"📊 Video file size: {video_size_mb:.1f} MB")
-                print(f"📊 {audio_type.capitalize()} audio size: {audio_size_mb:.1f} MB")
+                self.save_stamp(output_path, stamp)
+                log_lines = [
+                    f"✅ Successfully created: {output_path.name}",
+                    f"✅ {audio_type.capitalize()} audio saved: {processed_audio_path.name}",
+                ]
+                # Output sizes cost an extra stat per file, so only report them when asked
+                if self.verbose:
+                    video_size_mb = output_path.stat().st_size / (1024 * 1024)
+                    audio_size_mb = processed_audio_path.stat().st_size / (1024 * 1024)
+                    log_lines += [
+                        f"📊 Video file size: {video_size_mb:.1f} MB",
+                        f"📊 {audio_type.capitalize()} audio size: {audio_size_mb:.1f} MB",
+                    ]
+                sys.stdout.write("\n".join(log_lines) + "\n")
+                sys.stdout.flush()
                 return True
             else:
-                print("❌ Failed to create video!")
+                print("❌ Failed to create video!", flush=True)
                 return False
                 
         except Exception as e:
-            print(f"❌ Error processing file: {e}")
+            print(f"❌ Error processing file: {e}", flush=True)
             import traceback
             traceback.print_exc()
             return False
     
+    def find_duplicate_files(self, files):
+        """Find files that would render identical videos.
+        
+        Candidates must share audio size, episode title and episode image size;
+        only those are confirmed by hashing the full audio and image contents.
+        
+        Returns:
+            Dict mapping the first file of each duplicate group to the other files in it
+        """
+        candidates = defaultdict(list)
+        for path in files:
+            image = self.get_episode_image_path(path)
+            image_signature = self._file_signature(image)
+            key = (self.get_file_size(path), self.get_episode_title(path), image_signature and image_signature[1])
+            candidates[key].append((path, image))
+        
+        duplicates = {}
+        for group in candidates.values():
+            if len(group) < 2:
+                continue
+            by_content = defaultdict(list)
+            for path, image in group:
+                by_content[(self._content_hash(path), image and self._content_hash(image))].append(path)
+            for same in by_content.values():
+                if len(same) > 1:
+                    duplicates[same[0]] = same[1:]
+        return duplicates
+    
+    @staticmethod
+    def _content_hash(path, block_size=1 << 20):
+        """Hash a file's full contents."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def copy_outputs(self, source_file, duplicate_file):
+        """Reuse the video and processed audio rendered for source_file for an identical file."""
+        source_video, source_audio = self.get_output_paths(source_file)
+        output_path, processed_audio_path = self.get_output_paths(duplicate_file)
+        stamp = self.build_stamp(duplicate_file, self.get_episode_title(duplicate_file))
+        if not self.force and self.is_up_to_date(output_path, processed_audio_path, stamp):
+            print(f"⏭️  Up to date, skipping: {output_path.name} (use --force to re-process)")
+            return True
+        try:
+            shutil.copy2(source_video, output_path)
+            shutil.copy2(source_audio, processed_audio_path)
+        except OSError as e:
+            print(f"❌ Could not copy outputs for duplicate {duplicate_file.name}: {e}")
+            return False
+        self.save_stamp(output_path, stamp)
+        print(f"📋 {duplicate_file.name} is identical to {source_file.name}, copied: {output_path.name}")
+        return True
+    
+    def check_input_file(self, file_path):
+        """Cheaply check that an input file can be processed, before any heavy work.
+        
+        Reads only the first 12 bytes: the file must be readable, non-empty and,
+        for WAV/FLAC, start with the right header.
+        
+        Returns:
+            None if the file looks usable, otherwise a short reason
+        """
+        try:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                header = os.read(fd, 12)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            return f"cannot be read ({e.strerror})"
+        
+        if not header:
+            return "is empty"
+        for offset, accepted in self._AUDIO_SIGNATURES.get(file_path.suffix[1:].lower(), ()):
+            if header[offset:offset + 4] not in accepted:
+                return f"is not a valid {file_path.suffix[1:].upper()} file"
+        return None
+    
+    def process_files(self, selected_files):
+        """Process the selected files, using parallel worker processes when jobs > 1.
+        
+        Returns:
+            Tuple of (successful, failed) file counts
+        """
+        successful = 0
+        failed = 0
+        
+        # Skip unusable inputs up front instead of failing halfway through the pipeline
+        usable_files = []
+        for audio_file in selected_files:
+            problem = self.check_input_file(audio_file)
+            if problem:
+                print(f"⚠️  Skipping {audio_file.name}: file {problem}")
+                failed += 1
+            else:
+                usable_files.append(audio_file)
+        selected_files = usable_files
+        if not selected_files:
+            return successful, failed
+        
+        # Identical copies of a recording (same title and image) are rendered once, then copied
+        duplicates = self.find_duplicate_files(selected_files) if self.dedup else {}
+        if duplicates:
+            skipped = {path for copies in duplicates.values() for path in copies}
+            print(f"📋 {len(skipped)} duplicate file(s) will reuse the output of an identical file")
+            selected_files = [path for path in selected_files if path not in skipped]
+        
+        def record(audio_file, success):
+            nonlocal successful, failed
+            if success:
+                successful += 1
+            else:
+                failed += 1
+            for duplicate_file in duplicates.get(audio_file, ()):
+                if success and self.copy_outputs(audio_file, duplicate_file):
+                    successful += 1
+                else:
+                    failed += 1
+        
+        # Counter prefix for progress lines, padded so they line up
+        total = len(selected_files)
+        width = len(str(total))
+        
+        jobs = min(self.jobs, total)
+        if jobs <= 1:
+            for i, audio_file in enumerate(selected_files, 1):
+                print(f"\n[{i:>{width}}/{total}] " + "=" * 40)
+                record(audio_file, self.process_single_file(audio_file))
+            return successful, failed
+        
+        # Pick the encoder here rather than in every worker
+        try:
+            self.resolve_encoder()
+        except ValueError as e:
+            print(f"❌ {e}")
+            for audio_file in selected_files:
+                record(audio_file, False)
+            return successful, failed
+        
+        # Each job gets an equal share of the cores, split between FFmpeg's encoder threads and
+        # the frame-rendering threads (capped like VideoGenerator's default) so they don't oversubscribe
+        share = max(1, (os.cpu_count() or 1) // jobs)
+        render_workers = min(4, max(1, share // 2))
+        encoder_threads = max(1, share - render_workers)
+        
+        # Each file is independent, so hand whole files to worker processes
+        print(f"⚡ Running {jobs} parallel jobs (each file's log is shown when it finishes)")
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(self, encoder_threads, render_workers)
+        ) as executor:
+            # Submit the largest files first so a long file doesn't start last and
+            # leave the other workers idle at the end of the batch
+            futures = {
+                executor.submit(_process_file_in_worker, audio_file): audio_file
+                for audio_file in sorted(selected_files, key=self.get_file_size, reverse=True)
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                audio_file = futures[future]
+                try:
+                    success, log = future.result()
+                    # Print each worker's log in one piece so files don't interleave
+                    sys.stdout.write(log)
+                except Exception as e:
+                    print(f"❌ Error processing {audio_file.name}: {e}")
+                    success = False
+                
+                status = "✅ Done" if success else "❌ Failed"
+                print(f"\n[{i:>{width}}/{total}] {status}: {audio_file.name}")
+                record(audio_file, success)
+        
+        return successful, failed
+    
     def run_batch(self, single_file=None):
         """Run in batch mode (non-interactive) for HPC/automated processing.
         
@@ -369,30 +851,24 @@ class PodcastVideoConverter:
             print(f"✓ Found {len(selected_files)} audio file(s)")
         
         # Auto-generate titles for files not in episode_titles.json
-        print("\n📝 Setting up episode titles...")
+        # (report lines are collected and written in one go, which matters for large batches)
+        log_lines = ["\n📝 Setting up episode titles..."]
         for audio_file in selected_files:
             filename = audio_file.stem
             if filename not in self.episode_titles:
                 auto_title = self.generate_title_from_filename(filename)
                 self.episode_titles[filename] = auto_title
-                print(f"   ✓ Auto-generated title for '{filename}': '{auto_title}'")
+                log_lines.append(f"   ✓ Auto-generated title for '{filename}': '{auto_title}'")
             else:
-                print(f"   ✓ Using title for '{filename}': '{self.episode_titles[filename]}'")
+                log_lines.append(f"   ✓ Using title for '{filename}': '{self.episode_titles[filename]}'")
+        sys.stdout.write("\n".join(log_lines) + "\n")
+        self.save_episode_titles()
         
         # Process files
         print(f"\n🎯 Processing {len(selected_files)} file(s)...")
         print("💫 Optimizations: Intro/outro music will be cached for efficiency")
         
-        successful = 0
-        failed = 0
-        
-        for i, audio_file in enumerate(selected_files, 1):
-            print(f"\n[{i}/{len(selected_files)}] " + "=" * 40)
-            
-            if self.process_single_file(audio_file):
-                successful += 1
-            else:
-                failed += 1
+        successful, failed = self.process_files(selected_files)
         
         # Summary
         print("\n" + "=" * 80)
@@ -436,21 +912,13 @@ class PodcastVideoConverter:
         if not self.collect_all_episode_titles(selected_files):
             print("\n❌ Failed to collect episode titles. Exiting.")
             return
+        self.save_episode_titles()
         
         # Process selected files
         print(f"\n🎯 Processing {len(selected_files)} file(s)...")
         print("💫 Optimizations: Intro/outro music will be cached for efficiency")
         
-        successful = 0
-        failed = 0
-        
-        for i, wav_file in enumerate(selected_files, 1):
-            print(f"\n[{i}/{len(selected_files)}] " + "=" * 40)
-            
-            if self.process_single_file(wav_file):
-                successful += 1
-            else:
-                failed += 1
+        successful, failed = self.process_files(selected_files)
         
         # Summary
         print("\n" + "=" * 80)
@@ -472,10 +940,67 @@ class PodcastVideoConverter:
             print("  • Waveform animations sync perfectly with your audio")
 
 
+# Choices for --encoder (kept here so --help doesn't need to import video_generator)
+VIDEO_ENCODERS = ('libx264', 'auto', 'h264_nvenc', 'h264_qsv', 'h264_vaapi', 'h264_videotoolbox')
+
+# Converter owned by each worker process when files are processed in parallel
+_worker_converter = None
+
+
+def _init_worker(converter, encoder_threads=None, render_workers=1):
+    """Set up the converter used by a parallel worker process.
+    
+    The worker takes over the parent's converter (directories, titles, settings and
+    the already resolved encoder) instead of repeating its start-up work.
+    """
+    global _worker_converter
+    _worker_converter = converter
+    _worker_converter._init_components()
+    # Files already run in parallel, so don't nest a click-removal pool inside each worker
+    _worker_converter.audio_processor.max_workers = 1
+    # This worker's share of the cores (see process_files)
+    _worker_converter.video_generator.threads = encoder_threads
+    _worker_converter.video_generator.render_workers = render_workers
+
+
+def _process_file_in_worker(audio_file):
+    """Process one file inside a parallel worker process.
+    
+    Returns:
+        Tuple of (success, captured stdout) so the parent can print the log atomically
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        success = _worker_converter.process_single_file(audio_file)
+    return success, buffer.getvalue()
+
+
+def _default_jobs():
+    """Default for --jobs from PODCAST_JOBS; a malformed value falls back to 1 instead of breaking even --help."""
+    try:
+        return int(os.environ.get('PODCAST_JOBS', 1))
+    except ValueError:
+        print(f"⚠️  Ignoring PODCAST_JOBS={os.environ['PODCAST_JOBS']!r} (not a whole number), using 1 job")
+        return 1
+
+
+def _default_encoder():
+    """Default for --encoder from PODCAST_ENCODER (argparse doesn't check defaults against choices)."""
+    encoder = os.environ.get('PODCAST_ENCODER', 'libx264')
+    if encoder not in VIDEO_ENCODERS:
+        print(f"⚠️  Ignoring PODCAST_ENCODER={encoder!r} (expected one of: {', '.join(VIDEO_ENCODERS)}), "
+              f"using libx264")
+        return 'libx264'
+    return encoder
+
+
 def main():
     """Main entry point."""
     import argparse
     
+    default_jobs = _default_jobs()
+    default_encoder = _default_encoder()
+    
     parser = argparse.ArgumentParser(
         description="Codex Mentis Podcast Audio to Video Converter"
     )
@@ -494,11 +1019,62 @@ def main():
         type=str,
         help="Process a specific audio file (path or filename in input directory)."
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs,
+        help="Number of files to process in parallel (default: 1, or PODCAST_JOBS; 0 = half the CPU cores). "
+             "Each job needs its own memory for audio and video processing."
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Report output video and audio file sizes after each conversion."
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-process files even if their video is up to date with the audio, title and settings."
+    )
+    parser.add_argument(
+        "--encoder",
+        choices=VIDEO_ENCODERS,
+        default=default_encoder,
+        help="H.264 video encoder (default: libx264, or PODCAST_ENCODER). "
+             "'auto' uses the first hardware encoder that works on this machine (NVENC, QSV, "
+             "VideoToolbox, VAAPI) and falls back to libx264."
+    )
+    parser.add_argument(
+        "--preset",
+        help="Encoder speed/quality preset, e.g. 'veryfast' for libx264/QSV or 'p4' for NVENC "
+             "(default: the encoder's own, medium for libx264; VideoToolbox and VAAPI have none)."
+    )
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="Render every file even if it is an identical copy of another selected file."
+    )
+    parser.add_argument(
+        "--edit-titles",
+        action="store_true",
+        help="Edit all episode titles at once in $VISUAL/$EDITOR instead of one prompt per file."
+    )
     
     args = parser.parse_args()
     
     try:
-        converter = PodcastVideoConverter(enhance_audio=args.enhance_audio)
+        converter = PodcastVideoConverter(
+            enhance_audio=args.enhance_audio, jobs=args.jobs, verbose=args.verbose, force=args.force,
+            encoder=args.encoder, preset=args.preset, dedup=not args.no_dedup,
+            edit_titles=args.edit_titles
+        )
+        
+        if converter.jobs > 1:
+            # Keep numeric libraries single-threaded; the parallelism comes from the worker
+            # processes. This must happen before numpy/scipy are first imported (on first use,
+            # in this process), so the workers inherit single-threaded BLAS/OpenMP pools
+            for var in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+                os.environ.setdefault(var, '1')
         
         if args.batch or args.file:
             # Non-interactive batch mode
@@ -1,25 +1,101 @@
 import os
+import queue
+import subprocess
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
-try:
-    # Try moviepy 2.x imports
-    from moviepy import VideoClip, AudioFileClip, CompositeVideoClip
-except ImportError:
-    # Fall back to moviepy 1.x imports
-    from moviepy.editor import VideoClip, AudioFileClip, CompositeVideoClip
+import soundfile as sf
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import cv2
 from waveform_visualizer import WaveformVisualizer
 
 print(f"[DIAGNOSTIC] video_generator.py loaded from: {__file__}")
 
+# An RGBA overlay split for fast blending (see VideoGenerator.prepare_overlay)
+PreparedOverlay = namedtuple('PreparedOverlay', 'rgba rgb opaque ys xs premultiplied inverse_alpha')
+
+# TrueType fonts tried in order (cross-platform compatible)
+SERIF_FONTS = (
+    os.path.expanduser("~/.fonts/DejaVuSerif.ttf"),  # User's font directory (HPC)
+    "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf",  # Linux
+    "/usr/share/fonts/dejavu/DejaVuSerif.ttf",  # Alternative Linux path
+    "/System/Library/Fonts/Supplemental/Times New Roman.ttf",  # macOS
+    "C:\\Windows\\Fonts\\times.ttf",  # Windows
+    "times.ttf",  # Fallback
+    "Georgia.ttf",
+)
+SANS_FONTS = (
+    os.path.expanduser("~/.fonts/DejaVuSans.ttf"),  # User's font directory (HPC)
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",  # Alternative Linux path
+    "/System/Library/Fonts/Supplemental/Arial.ttf",  # macOS
+    "C:\\Windows\\Fonts\\arial.ttf",  # Windows
+    "arial.ttf",  # Fallback
+    "verdana.ttf",
+)
+
+
+@lru_cache(maxsize=128)
+def _load_font(candidates, size):
+    """Load the first of the candidate font files that exists at the given size.
+    
+    Cached so that repeated sizing and overlay passes don't re-parse font files.
+    Returns None if none of the candidates can be loaded.
+    """
+    for font_name in candidates:
+        try:
+            return ImageFont.truetype(font_name, size)
+        except Exception:
+            continue
+    return None
+
 
 class VideoGenerator:
     """Generates the final MP4 video with logo, waveform, and text overlays."""
     
+    # Selectable H.264 encoders and the quality/pixel-format options each one understands
+    ENCODER_PARAMS = {
+        'libx264': ['-crf', '23', '-pix_fmt', 'yuv420p'],
+        'h264_nvenc': ['-rc', 'vbr', '-cq', '23', '-pix_fmt', 'yuv420p'],
+        'h264_qsv': ['-global_quality', '23', '-pix_fmt', 'nv12'],
+        'h264_vaapi': ['-vaapi_device', '/dev/dri/renderD128', '-vf', 'format=nv12,hwupload', '-qp', '23'],
+        'h264_videotoolbox': ['-q:v', '65', '-pix_fmt', 'yuv420p'],
+    }
+    # Encoders that take a -preset option (VideoToolbox and VAAPI have none; NVENC names
+    # its presets p1-p7 plus a few x264-style ones such as 'fast' and 'slow')
+    PRESET_ENCODERS = ('libx264', 'h264_nvenc', 'h264_qsv')
+    # Hardware encoders tried by encoder='auto', in order of preference
+    HARDWARE_ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox', 'h264_vaapi')
+    
+    # Per-process results of FFmpeg encoder detection
+    _listed_encoders = None
+    _encoder_checks = {}
+    
     def __init__(self, width=1920, height=1080, fps=30):
         self.width = width
         self.height = height
         self.fps = fps
+        # FFmpeg encoder thread count (None lets FFmpeg decide)
+        self.threads = None
+        # Threads compositing frames in parallel (NumPy/OpenCV/Pillow release the GIL)
+        self.render_workers = min(4, os.cpu_count() or 1)
+        # H.264 encoder (see ENCODER_PARAMS / select_encoder) and its preset (None = encoder default)
+        self.encoder = 'libx264'
+        self.preset = None
+        # Prepared logo reused across videos: (path, mtime_ns, size) -> image
+        self._logo_cache = {}
+        # Background with the logo at its resting position: (key, (RGB array, position))
+        self._base_layer = (None, None)
+        # Full-screen episode image as a frame: (image, read-only RGB array)
+        self._fullscreen_frame = (None, None)
+        # Overlay images in use, prepared for blending: id -> (image, PreparedOverlay)
+        self._prepared_overlays = {}
+        # Fade lookup tables: alpha -> uint8 LUT
+        self._fade_luts = {}
+        # Drawn text overlays: (title, fonts, positions) -> RGBA image
+        self._text_overlay_cache = {}
         self.podcast_name = "Codex Mentis: Science and technology to study cognition"
         
         # Timing for thematic image display pattern (in seconds)
@@ -40,6 +116,77 @@ class VideoGenerator:
             'podcast': (180, 190, 200)  # Cool silver-grey for podcast name
         }
     
+    @staticmethod
+    def _ffmpeg_binary():
+        """Get the FFmpeg executable configured for moviepy (FFMPEG_BINARY or the bundled one)."""
+        try:
+            from moviepy.config import FFMPEG_BINARY
+            return FFMPEG_BINARY
+        except ImportError:
+            from moviepy.config import get_setting
+            return get_setting("FFMPEG_BINARY")
+    
+    @classmethod
+    def encoder_args(cls, encoder, preset=None):
+        """FFmpeg output options selecting an encoder, its quality settings and, where supported, its preset."""
+        args = ['-c:v', encoder, *cls.ENCODER_PARAMS.get(encoder, cls.ENCODER_PARAMS['libx264'])]
+        if preset and encoder in cls.PRESET_ENCODERS:
+            args += ['-preset', preset]
+        return args
+    
+    @classmethod
+    def encoder_works(cls, encoder, preset=None):
+        """Check whether FFmpeg can actually encode with an encoder (and preset) on this machine.
+        
+        Being compiled into FFmpeg isn't enough (e.g. NVENC without an NVIDIA GPU), and
+        preset names differ between encoders, so listed encoders get a tiny test encode
+        with the same options as the real one. Results are cached per process.
+        """
+        if (encoder, preset) in cls._encoder_checks:
+            return cls._encoder_checks[encoder, preset]
+        
+        ffmpeg = cls._ffmpeg_binary()
+        try:
+            if cls._listed_encoders is None:
+                listing = subprocess.run([ffmpeg, '-hide_banner', '-encoders'],
+                                         capture_output=True, text=True, timeout=30).stdout
+                cls._listed_encoders = {line.split()[1] for line in listing.splitlines()
+                                        if len(line.split()) > 1}
+            works = encoder in cls._listed_encoders and subprocess.run(
+                [ffmpeg, '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1,format=rgb24', '-frames:v', '1',
+                 *cls.encoder_args(encoder, preset), '-f', 'null', '-'],
+                capture_output=True, timeout=30
+            ).returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            works = False
+        
+        cls._encoder_checks[encoder, preset] = works
+        return works
+    
+    @classmethod
+    def select_encoder(cls, requested='libx264', preset=None):
+        """Resolve and check the requested encoder; 'auto' picks the first working hardware encoder.
+        
+        Raises:
+            ValueError: If FFmpeg can't encode with the resolved encoder and preset
+        """
+        encoder = requested
+        if requested == 'auto':
+            encoder = next((name for name in cls.HARDWARE_ENCODERS if cls.encoder_works(name, preset)), None)
+            if encoder:
+                print(f"🚀 Using hardware video encoder: {encoder}")
+            else:
+                print("ℹ️  No hardware video encoder available, using libx264")
+                encoder = 'libx264'
+        
+        if preset and encoder not in cls.PRESET_ENCODERS:
+            print(f"ℹ️  {encoder} has no presets, ignoring preset '{preset}'")
+        if not cls.encoder_works(encoder, preset):
+            preset_note = f" with preset '{preset}'" if preset and encoder in cls.PRESET_ENCODERS else ""
+            raise ValueError(f"FFmpeg cannot encode with {encoder}{preset_note} on this machine")
+        return encoder
+    
     def get_view_state(self, time_position, duration):
         """Determine the current view state based on time position.
         
@@ -149,6 +296,22 @@ class VideoGenerator:
             print(f"✗ Error loading logo: {e}")
             return None
     
+    def get_prepared_logo(self, logo_path):
+        """Get the prepared logo, decoding and preparing it only once per file version.
+        
+        The logo is the same for every episode, so batch runs reuse it instead of
+        decoding, masking and blurring it again for each video.
+        """
+        try:
+            stat = os.stat(logo_path)
+        except OSError:
+            return self.load_and_prepare_logo(logo_path)
+        
+        key = (str(logo_path), stat.st_mtime_ns, stat.st_size)
+        if key not in self._logo_cache:
+            self._logo_cache = {key: self.load_and_prepare_logo(logo_path)}
+        return self._logo_cache[key]
+    
     def load_and_prepare_episode_image(self, episode_image_path):
         """Load and prepare an optional episode-specific image with golden yellow gradient frame.
         Dynamically sizes to fit available space while respecting margins."""
@@ -260,14 +423,12 @@ class VideoGenerator:
             episode_y: Y position of the image on the canvas
         
         Returns:
-            PIL Image with animated light overlay
+            Tuple of (PIL Image with the animated light, (x, y) canvas position of that image),
+            or None. The image only covers the light and its blurred glow, not the whole canvas.
         """
         if image is None:
             return None
         
-        light_overlay = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(light_overlay)
-        
         # Complete one full cycle every 24 seconds
         cycle_duration = 24.0
         progress = (time_position % cycle_duration) / cycle_duration
@@ -306,6 +467,16 @@ class VideoGenerator:
             light_x = episode_x + frame_center_offset
             light_y = episode_y + img_height - frame_center_offset - (current_pos - 2 * frame_rect_width - frame_rect_height)
         
+        # Draw on a small canvas around the light: the outer glow radius plus the blur's reach
+        blur_radius = 6
+        half_size = 20 + 4 * blur_radius
+        origin_x = int(light_x) - half_size
+        origin_y = int(light_y) - half_size
+        light_overlay = Image.new('RGBA', (2 * half_size + 1, 2 * half_size + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(light_overlay)
+        light_x -= origin_x
+        light_y -= origin_y
+        
         light_color = (255, 255, 255)
         golden_color = (255, 235, 110)
         draw.ellipse(
@@ -330,9 +501,9 @@ class VideoGenerator:
         )
         
         # Apply Gaussian blur for smooth, natural glow
-        light_overlay = light_overlay.filter(ImageFilter.GaussianBlur(radius=6))
+        light_overlay = light_overlay.filter(ImageFilter.GaussianBlur(radius=blur_radius))
         
-        return light_overlay
+        return light_overlay, (origin_x, origin_y)
     
     def load_and_prepare_fullscreen_image(self, episode_image_path):
         """Load and prepare a full-screen version of the episode image for zoom transitions.
@@ -379,6 +550,45 @@ class VideoGenerator:
             print(f"✗ Error loading full-screen episode image: {e}")
             return None
 
+    @staticmethod
+    def _fit_font_size(load_font, text, min_size, max_size, max_width, max_height, draw):
+        """Pick the font size at which text fills max_width x max_height.
+        
+        Text extent grows almost linearly with font size, so the largest size that fits
+        is solved from a single measurement at max_size, then confirmed against its
+        neighbours (hinting can move it by a pixel or two). The bisection between
+        min_size and max_size (to within 2px) is replayed against that limit, so the
+        size is the one a full search would pick without loading a font at every step.
+        
+        Returns:
+            Tuple of (font size, font), with a size strictly between min_size and max_size,
+            or (min_size, None) if no TrueType font loads or no size fits
+        """
+        def fits(size):
+            left, top, right, bottom = draw.textbbox((0, 0), text, font=load_font(size))
+            return right - left <= max_width and bottom - top <= max_height
+        
+        font = load_font(max_size)
+        if font is None:
+            return min_size, None
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        largest = int(max_size * min(max_width / max(right - left, 1), max_height / max(bottom - top, 1)))
+        largest = max(min_size - 1, min(max_size - 1, largest))
+        while largest >= min_size and not fits(largest):
+            largest -= 1
+        while largest + 1 < max_size and fits(largest + 1):
+            largest += 1
+        
+        # Replay the bisection: a size fits exactly when it is at most `largest`
+        low, high, best = min_size, max_size, None
+        while high - low > 2:
+            size = (low + high) // 2
+            if size <= largest:
+                best = low = size
+            else:
+                high = size
+        return (best, load_font(best)) if best is not None else (min_size, None)
+    
     def create_text_overlay(self, episode_title, episode_image=None, time_position=0, duration=1, cached_fonts=None):
         """Create elegant text overlay with episode title at top and podcast name at bottom.
         Dynamically sizes fonts to maximize available space between screen edges and thematic image.
@@ -433,82 +643,23 @@ class VideoGenerator:
             temp_draw = ImageDraw.Draw(temp_img)
             
             # --- Dynamically size episode title to fill available top space ---
-            # Use binary search to find the largest font that fits
             min_title_font_size = 40
             max_title_font_size = max(int(available_top_space * 2.5), 150)  # Moderate sizing
-            title_font_size = max_title_font_size
-            best_title_font_size = min_title_font_size
-            episode_font = None
-            font_loaded_successfully = False
-            
-            # Binary search for optimal font size
-            while max_title_font_size - min_title_font_size > 2:
-                title_font_size = (min_title_font_size + max_title_font_size) // 2
-                
-                # Try to load TrueType font (cross-platform compatible)
-                test_font = None
-                home_fonts = os.path.expanduser("~/.fonts/DejaVuSerif.ttf")  # User-installed fonts
-                for font_name in [
-                    home_fonts,  # User's font directory (HPC)
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf",  # Linux
-                    "/usr/share/fonts/dejavu/DejaVuSerif.ttf",  # Alternative Linux path
-                    "/System/Library/Fonts/Supplemental/Times New Roman.ttf",  # macOS
-                    "C:\\Windows\\Fonts\\times.ttf",  # Windows
-                    "times.ttf",  # Fallback
-                    "Georgia.ttf",
-                ]:
-                    try:
-                        test_font = ImageFont.truetype(font_name, title_font_size)
-                        font_loaded_successfully = True
-                        break
-                    except Exception as e:
-                        continue
-                
-                if test_font is None:
-                    # Fonts not available - print warning but continue with PIL default rendering
-                    if not font_loaded_successfully:
-                        print(f"  ⚠️ No TrueType fonts available (tried Linux/Mac/Windows paths)")
-                        print(f"     Using PIL ImageDraw text rendering with size {title_font_size}")
-                        print(f"     ⚠️⚠️⚠️ WARNING: Default font ignores size - text will be tiny!")
-                    # Use PIL text drawing instead - create a font-like object
-                    test_font = ImageFont.load_default()
-                    # For default font, we'll use text drawing directly later
-                
-                episode_bbox = temp_draw.textbbox((0, 0), clean_title, font=test_font)
-                episode_width = episode_bbox[2] - episode_bbox[0]
-                episode_height = episode_bbox[3] - episode_bbox[1]
-                
-                # Check if it fits within usable width (respecting margins)
-                if episode_width <= usable_width and episode_height <= available_top_space * 0.9:
-                    # Fits! Try larger
-                    best_title_font_size = title_font_size
-                    episode_font = test_font
-                    min_title_font_size = title_font_size
-                else:
-                    # Too big, try smaller
-                    max_title_font_size = title_font_size
+            best_title_font_size, episode_font = self._fit_font_size(
+                lambda size: _load_font(SERIF_FONTS, size), clean_title, min_title_font_size, max_title_font_size,
+                usable_width, available_top_space * 0.9, temp_draw
+            )
+            if episode_font is None and _load_font(SERIF_FONTS, min_title_font_size) is None:
+                # Fonts not available - the default font is used below
+                print(f"  ⚠️ No TrueType fonts available (tried Linux/Mac/Windows paths)")
             
             # Use the best size we found
             title_font_size = best_title_font_size
             if episode_font is None:
-                font_loaded = False
-                home_fonts = os.path.expanduser("~/.fonts/DejaVuSerif.ttf")
-                for font_name in [
-                    home_fonts,  # User's font directory (HPC)
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf",  # Linux
-                    "/System/Library/Fonts/Supplemental/Times New Roman.ttf",  # macOS
-                    "C:\\Windows\\Fonts\\times.ttf",  # Windows
-                    "times.ttf",
-                    "Georgia.ttf",
-                ]:
-                    try:
-                        episode_font = ImageFont.truetype(font_name, title_font_size)
-                        print(f"  ✓ Episode font loaded: {font_name} @ {title_font_size}px")
-                        font_loaded = True
-                        break
-                    except:
-                        continue
-                if episode_font is None:
+                episode_font = _load_font(SERIF_FONTS, title_font_size)
+                if episode_font is not None:
+                    print(f"  ✓ Episode font loaded: {episode_font.path} @ {title_font_size}px")
+                else:
                     print(f"  ⚠️⚠️⚠️ CRITICAL: Using default font for episode title (TrueType fonts not found)")
                     print(f"  ⚠️⚠️⚠️ TEXT WILL BE TINY! Install DejaVu fonts or liberation-fonts on HPC")
                     episode_font = ImageFont.load_default()
@@ -522,66 +673,17 @@ class VideoGenerator:
             
             min_podcast_font_size = 40
             max_podcast_font_size = max(int(available_bottom_space * 2.5), 150)
-            podcast_font_size = max_podcast_font_size
-            best_podcast_font_size = min_podcast_font_size
-            podcast_font = None
-            
-            # Binary search for optimal font size
-            while max_podcast_font_size - min_podcast_font_size > 2:
-                podcast_font_size = (min_podcast_font_size + max_podcast_font_size) // 2
-                
-                test_font = None
-                home_fonts_sans = os.path.expanduser("~/.fonts/DejaVuSans.ttf")
-                for font_name in [
-                    home_fonts_sans,  # User's font directory (HPC)
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
-                    "/usr/share/fonts/dejavu/DejaVuSans.ttf",  # Alternative Linux path
-                    "/System/Library/Fonts/Supplemental/Arial.ttf",  # macOS
-                    "C:\\Windows\\Fonts\\arial.ttf",  # Windows
-                    "arial.ttf",  # Fallback
-                    "verdana.ttf",
-                ]:
-                    try:
-                        test_font = ImageFont.truetype(font_name, podcast_font_size)
-                        break
-                    except Exception as e:
-                        continue
-                
-                if test_font is None:
-                    # Fall back to default font
-                    test_font = ImageFont.load_default()
-                
-                podcast_bbox = temp_draw.textbbox((0, 0), self.podcast_name, font=test_font)
-                podcast_width = podcast_bbox[2] - podcast_bbox[0]
-                podcast_height = podcast_bbox[3] - podcast_bbox[1]
-                
-                if podcast_width <= usable_width and podcast_height <= available_bottom_space * 0.9:
-                    best_podcast_font_size = podcast_font_size
-                    podcast_font = test_font
-                    min_podcast_font_size = podcast_font_size
-                else:
-                    max_podcast_font_size = podcast_font_size
+            best_podcast_font_size, podcast_font = self._fit_font_size(
+                lambda size: _load_font(SANS_FONTS, size), self.podcast_name, min_podcast_font_size, max_podcast_font_size,
+                usable_width, available_bottom_space * 0.9, temp_draw
+            )
             
             podcast_font_size = best_podcast_font_size
             if podcast_font is None:
-                font_loaded = False
-                home_fonts_sans = os.path.expanduser("~/.fonts/DejaVuSans.ttf")
-                for font_name in [
-                    home_fonts_sans,  # User's font directory (HPC)
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
-                    "/System/Library/Fonts/Supplemental/Arial.ttf",  # macOS
-                    "C:\\Windows\\Fonts\\arial.ttf",  # Windows
-                    "arial.ttf",
-                    "verdana.ttf",
-                ]:
-                    try:
-                        podcast_font = ImageFont.truetype(font_name, podcast_font_size)
-                        print(f"  ✓ Podcast font loaded: {font_name} @ {podcast_font_size}px")
-                        font_loaded = True
-                        break
-                    except:
-                        continue
-                if podcast_font is None:
+                podcast_font = _load_font(SANS_FONTS, podcast_font_size)
+                if podcast_font is not None:
+                    print(f"  ✓ Podcast font loaded: {podcast_font.path} @ {podcast_font_size}px")
+                else:
                     print(f"  ⚠️⚠️⚠️ CRITICAL: Using default font for podcast name (TrueType fonts not found)")
                     print(f"  ⚠️⚠️⚠️ TEXT WILL BE TINY! Install DejaVu fonts or liberation-fonts on HPC")
                     podcast_font = ImageFont.load_default()
@@ -629,6 +731,45 @@ class VideoGenerator:
             else:
                 podcast_y = self.height - int(self.height * 0.05) - podcast_height
         
+        # The drawn text only depends on the title, fonts and positions: draw it once
+        # (fade-in frames only scale its alpha)
+        cache_key = (episode_title, clean_title, id(episode_font), id(podcast_font),
+                     episode_x, episode_y, podcast_x, podcast_y)
+        text_img = self._text_overlay_cache.get(cache_key)
+        if text_img is None:
+            text_img = self._draw_text_overlay(
+                episode_title, clean_title, episode_font, podcast_font, episode_x, episode_y, podcast_x, podcast_y
+            )
+            if len(self._text_overlay_cache) >= 8:
+                self._text_overlay_cache.clear()
+            self._text_overlay_cache[cache_key] = text_img
+        
+        # Title fade-in effect (first 2 seconds) - only applied when time_position > 0
+        fade_duration = 2.0
+        if time_position < fade_duration and time_position > 0:
+            alpha_multiplier = time_position / fade_duration  # 0.0 to 1.0
+            # Apply fade by modulating alpha channel (on a copy; the cached overlay stays opaque)
+            text_img = text_img.copy()
+            alpha_channel = text_img.split()[3]  # Get alpha channel
+            alpha_array = np.array(alpha_channel)
+            alpha_array = (alpha_array * alpha_multiplier).astype(np.uint8)
+            text_img.putalpha(Image.fromarray(alpha_array))
+        
+        # Return overlay and font cache for future frames
+        font_cache = {
+            'episode_font': episode_font,
+            'podcast_font': podcast_font,
+            'episode_x': episode_x,
+            'episode_y': episode_y,
+            'podcast_x': podcast_x,
+            'podcast_y': podcast_y,
+            'clean_title': clean_title
+        }
+        
+        return text_img, font_cache
+    
+    def _draw_text_overlay(self, episode_title, clean_title, episode_font, podcast_font, episode_x, episode_y, podcast_x, podcast_y):
+        """Draw the episode title and podcast name, with their glow, on a transparent canvas."""
         text_img = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(text_img)
         
@@ -667,28 +808,7 @@ class VideoGenerator:
         # Draw podcast name in distinct color
         draw.text((podcast_x, podcast_y), self.podcast_name, font=podcast_font, fill=self.colors['podcast'])
         
-        # Title fade-in effect (first 2 seconds) - only applied when time_position > 0
-        fade_duration = 2.0
-        if time_position < fade_duration and time_position > 0:
-            alpha_multiplier = time_position / fade_duration  # 0.0 to 1.0
-            # Apply fade by modulating alpha channel
-            alpha_channel = text_img.split()[3]  # Get alpha channel
-            alpha_array = np.array(alpha_channel)
-            alpha_array = (alpha_array * alpha_multiplier).astype(np.uint8)
-            text_img.putalpha(Image.fromarray(alpha_array))
-        
-        # Return overlay and font cache for future frames
-        font_cache = {
-            'episode_font': episode_font,
-            'podcast_font': podcast_font,
-            'episode_x': episode_x,
-            'episode_y': episode_y,
-            'podcast_x': podcast_x,
-            'podcast_y': podcast_y,
-            'clean_title': clean_title
-        }
-        
-        return text_img, font_cache
+        return text_img
     
     def animate_logo_scale(self, time_position, duration, base_scale=1.0, amplitude=0.05, frequency=0.5):
         """Create breathing animation for the logo."""
@@ -722,9 +842,10 @@ class VideoGenerator:
             shake_amount = min(avg_intensity * 10, 5)  # Max 5 pixels
             # Use time-based randomness for smooth shake
             seed_offset = int(time_position * 100)  # Change seed frequently but deterministically
-            np.random.seed(seed_offset)
-            x_offset = np.random.randint(-shake_amount, shake_amount + 1)
-            y_offset = np.random.randint(-shake_amount, shake_amount + 1)
+            # (a private generator, so frames rendered on parallel threads don't race on the global one)
+            rng = np.random.RandomState(seed_offset)
+            x_offset = rng.randint(-shake_amount, shake_amount + 1)
+            y_offset = rng.randint(-shake_amount, shake_amount + 1)
             return (int(x_offset), int(y_offset))
         else:
             return (0, 0)
@@ -740,7 +861,11 @@ class VideoGenerator:
         # Determine current view state
         view_state, transition_progress = self.get_view_state(time_position, duration)
         
-        # Create the composite frame (always needed for transitions)
+        # The full-screen image hides the composite view entirely, so don't render it then
+        if fullscreen_image is not None and view_state == 'fullscreen':
+            return self._create_fullscreen_view(fullscreen_image)
+        
+        # Create the composite frame (also needed for transitions)
         composite = self._create_composite_view(waveform_frame, logo, text_overlay, time_position, duration, episode_image, waveform_data)
         
         # If no fullscreen image is available, always return composite
@@ -750,8 +875,6 @@ class VideoGenerator:
         # Handle different view states
         if view_state == 'composite':
             return composite
-        elif view_state == 'fullscreen':
-            return self._create_fullscreen_view(fullscreen_image)
         elif view_state == 'zoom_in':
             # Transition from composite to fullscreen
             return self._create_zoom_transition(composite, fullscreen_image, transition_progress, zoom_in=True)
@@ -761,48 +884,121 @@ class VideoGenerator:
         
         return composite
     
+    def _clamp_logo_position(self, logo, logo_x, logo_y):
+        """Keep the logo on screen."""
+        logo_y = max(50, min(self.height - logo.height - 50, logo_y))
+        logo_x = max(10, min(self.width - logo.width - 10, logo_x))
+        return logo_x, logo_y
+    
+    @staticmethod
+    def prepare_overlay(rgba):
+        """Precompute what blend_into needs from an RGBA uint8 overlay.
+        
+        Overlay alpha is almost always 0 or 255: opaque pixels are copied through a
+        mask, and only the few semi-transparent ones are blended, using colours
+        premultiplied by their alpha.
+        """
+        alpha = cv2.extractChannel(rgba, 3)
+        points = cv2.findNonZero(cv2.inRange(alpha, 1, 254))
+        if points is None:
+            xs = ys = np.empty(0, dtype=np.intp)
+        else:
+            xs, ys = points.reshape(-1, 2).T
+        partial = rgba[ys, xs].astype(np.uint16)
+        partial_alpha = partial[:, 3:]
+        return PreparedOverlay(
+            rgba=rgba,
+            rgb=cv2.cvtColor(rgba, cv2.COLOR_RGBA2RGB),
+            opaque=cv2.compare(alpha, 255, cv2.CMP_EQ),
+            ys=ys,
+            xs=xs,
+            # src * a, plus 127 so the division by 255 below rounds
+            premultiplied=partial[:, :3] * partial_alpha + 127,
+            inverse_alpha=255 - partial_alpha
+        )
+    
+    @classmethod
+    def blend_into(cls, frame, overlay, x=0, y=0):
+        """Alpha-blend an overlay onto an RGB uint8 frame in place, at (x, y).
+        
+        Equivalent to pasting with the overlay's alpha as mask, on the overlapping
+        region only (the overlay is clipped to the frame).
+        
+        Args:
+            overlay: RGBA uint8 array, or a PreparedOverlay for overlays reused across frames
+        """
+        rgba = overlay.rgba if isinstance(overlay, PreparedOverlay) else overlay
+        height, width = frame.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + rgba.shape[1], width), min(y + rgba.shape[0], height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if not isinstance(overlay, PreparedOverlay) or (x1 - x0, y1 - y0) != (rgba.shape[1], rgba.shape[0]):
+            overlay = cls.prepare_overlay(rgba[y0 - y:y1 - y, x0 - x:x1 - x])
+        roi = frame[y0:y1, x0:x1]
+        
+        cv2.copyTo(overlay.rgb, overlay.opaque, roi)
+        if len(overlay.ys):
+            ys, xs = overlay.ys, overlay.xs
+            # (dst * (255 - a) + src * a + 127) / 255; the sum fits in uint16
+            roi[ys, xs] = (roi[ys, xs] * overlay.inverse_alpha + overlay.premultiplied) // 255
+    
+    def _prepared_overlay(self, image):
+        """PreparedOverlay of a PIL image, computed once per image object."""
+        cached = self._prepared_overlays.get(id(image))
+        if cached is None or cached[0] is not image:
+            if len(self._prepared_overlays) >= 8:
+                self._prepared_overlays.clear()
+            rgba = image if image.mode == 'RGBA' else image.convert('RGBA')
+            cached = self._prepared_overlays[id(image)] = (image, self.prepare_overlay(np.asarray(rgba)))
+        return cached[1]
+    
+    def _get_base_layer(self, logo):
+        """Get the background with the logo blended at its resting position.
+        
+        Both are the same for every frame of a video, so they are composited once
+        and each frame starts from a copy.
+        
+        Returns:
+            Tuple of (RGB uint8 array, (logo_x, logo_y) resting position or None)
+        """
+        key = (id(logo), logo.size) if logo is not None else None
+        cached_key, cached = self._base_layer
+        if cached is None or cached_key != key:
+            base = np.empty((self.height, self.width, 3), dtype=np.uint8)
+            base[...] = self.colors['background']
+            position = None
+            if logo is not None:
+                # Logo on the left side, vertically centered with the waveform
+                position = self._clamp_logo_position(logo, 30, self.height // 2 - logo.height // 2)
+                self.blend_into(base, self._prepared_overlay(logo), *position)
+            cached = (base, position)
+            self._base_layer = (key, cached)
+        return cached
+    
     def _create_composite_view(self, waveform_frame, logo, text_overlay, time_position, duration, episode_image=None, waveform_data=None):
-        """Create the standard composite view with logo, waveform, and episode image."""
-        # Start with the background color
-        frame = Image.new('RGB', (self.width, self.height), (20, 25, 35))  # Background color
-        frame = frame.convert('RGBA')
+        """Create the standard composite view with logo, waveform, and episode image.
+        
+        Layers are blended with NumPy straight into one RGB array (no PIL RGBA
+        images or mode conversions per frame).
+        """
+        # Start with the background and the logo at rest (underneath everything)
+        base, logo_position = self._get_base_layer(logo)
+        frame = base.copy()
         
-        # Add logo first (underneath everything)
         if logo is not None:
-            # Logo at original size (no animation for performance)
-            animated_logo = logo
-            
-            # Position logo on left side, integrated with waveform area
-            base_logo_x = 30  # Left margin (moved further left)
-            base_logo_y = self.height // 2 - animated_logo.height // 2  # Vertically centered with waveform
-            
-            # Apply shake effect on audio peaks
+            # Apply shake effect on audio peaks (logo at original size, no animation for performance)
             shake_x, shake_y = self.calculate_logo_shake(waveform_data, time_position)
-            logo_x = base_logo_x + shake_x
-            logo_y = base_logo_y + shake_y
-            
-            # Ensure logo doesn't go off screen
-            logo_y = max(50, min(self.height - animated_logo.height - 50, logo_y))
-            logo_x = max(10, min(self.width - animated_logo.width - 10, logo_x))
-            
-            # Composite logo onto background
-            frame.paste(animated_logo, (logo_x, logo_y), animated_logo)
-        
-        # Only apply waveform overlay if it's not just a plain background
-        # Check if waveform has visual content (not just background color)
-        waveform_rgba = Image.fromarray(waveform_frame).convert('RGBA')
-        waveform_np = np.array(waveform_rgba)
-        background_color = np.array([20, 25, 35, 255])
+            if shake_x or shake_y:
+                rest_x, rest_y = logo_position
+                logo_x, logo_y = self._clamp_logo_position(logo, rest_x + shake_x, rest_y + shake_y)
+                if (logo_x, logo_y) != logo_position:
+                    # Move the logo: clear it from its resting position, then blend it shaken
+                    frame[rest_y:rest_y + logo.height, rest_x:rest_x + logo.width] = self.colors['background']
+                    self.blend_into(frame, self._prepared_overlay(logo), logo_x, logo_y)
         
-        # Check if waveform has any pixels different from background
-        has_waveform_content = not np.all(waveform_np[:, :, :3] == background_color[:3])
-        
-        if has_waveform_content:
-            # Create a semi-transparent version of the waveform
-            waveform_overlay = Image.new('RGBA', waveform_rgba.size, (0, 0, 0, 0))
-            waveform_overlay.paste(waveform_rgba, (0, 0))
-            # Apply the waveform over the frame with logo
-            frame = Image.alpha_composite(frame, waveform_overlay)
+        # Waveform over the background and logo (transparent pixels leave the frame as is)
+        self.blend_into(frame, waveform_frame)
         
         # Add episode-specific image on top of waveform (if provided)
         if episode_image is not None:
@@ -816,19 +1012,18 @@ class VideoGenerator:
             episode_y = (self.height - episode_image.height) // 2
             
             # Composite episode image on top of waveform
-            frame.paste(episode_image, (episode_x, episode_y), episode_image)
+            self.blend_into(frame, self._prepared_overlay(episode_image), episode_x, episode_y)
             
             # Add animated light effect traveling around the frame
-            light_overlay = self.add_animated_light_to_frame(episode_image, time_position, duration, episode_x, episode_y)
-            if light_overlay is not None:
-                frame = Image.alpha_composite(frame, light_overlay)
+            light = self.add_animated_light_to_frame(episode_image, time_position, duration, episode_x, episode_y)
+            if light is not None:
+                light_overlay, light_position = light
+                self.blend_into(frame, np.asarray(light_overlay), *light_position)
         
         # Add text overlay (positioned at top as specified)
-        frame.paste(text_overlay, (0, 0), text_overlay)
+        self.blend_into(frame, self._prepared_overlay(text_overlay))
         
-        # Convert back to RGB array
-        frame_rgb = frame.convert('RGB')
-        return np.array(frame_rgb)
+        return frame
     
     def _create_fullscreen_view(self, fullscreen_image):
         """Create the full-screen thematic image view."""
@@ -837,9 +1032,13 @@ class VideoGenerator:
             frame = Image.new('RGB', (self.width, self.height), self.colors['background'])
             return np.array(frame)
         
-        # Convert fullscreen image to RGB array
-        frame_rgb = fullscreen_image.convert('RGB')
-        return np.array(frame_rgb)
+        # Converted to an RGB array once; every full-screen frame is the same
+        cached_image, frame = self._fullscreen_frame
+        if cached_image is not fullscreen_image:
+            frame = cv2.cvtColor(np.asarray(fullscreen_image.convert('RGBA')), cv2.COLOR_RGBA2RGB)
+            frame.setflags(write=False)
+            self._fullscreen_frame = (fullscreen_image, frame)
+        return frame
     
     def _create_zoom_transition(self, composite_frame, fullscreen_image, progress, zoom_in=True):
         """Create a smooth zoom transition between composite and fullscreen views.
@@ -861,9 +1060,7 @@ class VideoGenerator:
             # Reverse the progress for zoom-out
             eased_progress = 1 - eased_progress
         
-        # Convert frames to PIL Images for blending
-        composite_img = Image.fromarray(composite_frame).convert('RGBA')
-        fullscreen_img = fullscreen_image.convert('RGBA') if fullscreen_image else composite_img
+        fullscreen_frame = self._create_fullscreen_view(fullscreen_image) if fullscreen_image else composite_frame
         
         # Calculate zoom scale (1.0 = normal, up to 1.3 for zoom effect)
         # During zoom-in: composite zooms in and fades out, fullscreen fades in
@@ -875,22 +1072,21 @@ class VideoGenerator:
         scaled_width = int(self.width * zoom_scale)
         scaled_height = int(self.height * zoom_scale)
         
-        # Zoom the composite view
-        composite_zoomed = composite_img.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
+        # Zoom the composite view (bicubic: a magnification of at most 15% mid cross-fade,
+        # where it is indistinguishable from Lanczos at a fraction of the cost)
+        composite_zoomed = cv2.resize(composite_frame, (scaled_width, scaled_height), interpolation=cv2.INTER_CUBIC)
         
         # Crop to center
         left = (scaled_width - self.width) // 2
         top = (scaled_height - self.height) // 2
-        composite_cropped = composite_zoomed.crop((left, top, left + self.width, top + self.height))
+        composite_cropped = composite_zoomed[top:top + self.height, left:left + self.width]
         
         # Blend composite and fullscreen based on progress
         # Alpha blend: composite fades out, fullscreen fades in
         alpha = eased_progress
         
         # Create blended result
-        result = Image.blend(composite_cropped.convert('RGB'), fullscreen_img.convert('RGB'), alpha)
-        
-        return np.array(result)
+        return cv2.addWeighted(composite_cropped, 1 - alpha, fullscreen_frame, alpha, 0)
     
     def apply_video_fade(self, frames, fade_duration_seconds=2.0):
         """Apply fade-in and fade-out effects to video frames."""
@@ -916,6 +1112,128 @@ class VideoGenerator:
         print("✓ Video fade effects applied!")
         return frames
     
+    def _fade_lut(self, alpha):
+        """Lookup table scaling uint8 values by alpha (as (value * alpha).astype(uint8) would).
+        
+        Fades only use a few dozen distinct alphas, so each table is built once and
+        applied with cv2.LUT instead of multiplying every pixel.
+        """
+        lut = self._fade_luts.get(alpha)
+        if lut is None:
+            lut = self._fade_luts[alpha] = (np.arange(256) * alpha).astype(np.uint8)
+        return lut
+    
+    def map_frames(self, render, items):
+        """Yield render(item) for each item, in order, using render_workers threads.
+        
+        At most two frames per worker are in flight, so memory stays bounded.
+        """
+        if self.render_workers <= 1:
+            yield from map(render, items)
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.render_workers, thread_name_prefix="frame-render") as executor:
+            pending = deque()
+            try:
+                for item in items:
+                    pending.append(executor.submit(render, item))
+                    if len(pending) >= 2 * self.render_workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+    
+    @staticmethod
+    def prefetch_frames(frames, maxsize=8):
+        """Render frames in a background thread, yielding them through a bounded queue.
+        
+        Frame rendering (NumPy/OpenCV/PIL) then overlaps with writes to FFmpeg's
+        stdin, which block while the encoder catches up. The queue holds at most
+        maxsize frames (~6 MB each at 1080p) so memory stays bounded.
+        """
+        buffer = queue.Queue(maxsize)
+        stop = threading.Event()
+        end = object()
+        
+        def put(item):
+            # Give up if the consumer has stopped, instead of blocking on a full queue forever
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        def produce():
+            try:
+                for frame in frames:
+                    if not put((frame, None)):
+                        return
+                put((end, None))
+            except BaseException as e:
+                put((end, e))
+        
+        producer = threading.Thread(target=produce, name="frame-prefetch", daemon=True)
+        producer.start()
+        try:
+            while True:
+                frame, error = buffer.get()
+                if error is not None:
+                    raise error
+                if frame is end:
+                    return
+                yield frame
+        finally:
+            stop.set()
+            producer.join()
+    
+    def write_video(self, frames, audio_path, output_path, stdin_bufsize=1 << 20):
+        """Encode RGB frames and the audio file into an MP4 with a single FFmpeg process.
+        
+        Frames are piped to FFmpeg's stdin as raw rgb24 (through a 1 MiB buffer), and
+        the audio is read straight from audio_path, so nothing is written to disk
+        besides the output video.
+        """
+        cmd = [
+            self._ffmpeg_binary(), '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-vcodec', 'rawvideo',
+            '-s', f'{self.width}x{self.height}', '-pix_fmt', 'rgb24', '-r', str(self.fps),
+            '-i', '-',
+            '-i', audio_path,
+            '-map', '0:v', '-map', '1:a',
+            # Constant-quality setting, a player-compatible pixel format and the preset, per encoder
+            *self.encoder_args(self.encoder, self.preset),
+            *(['-threads', str(self.threads)] if self.threads else []),
+            '-c:a', 'aac',
+            output_path
+        ]
+        
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, bufsize=stdin_bufsize)
+        try:
+            for frame in frames:
+                # Contiguous uint8 view written as-is (no intermediate bytes copy)
+                proc.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).data)
+            proc.stdin.close()
+        except BrokenPipeError:
+            # FFmpeg exited early; its error message is reported below
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        
+        error_output = proc.stderr.read()
+        proc.stderr.close()
+        if proc.wait() != 0:
+            raise RuntimeError(f"FFmpeg failed: {error_output.decode(errors='replace').strip()}")
+    
     def create_video(self, audio_path, waveform_frame_generator, episode_title, output_path, logo_path=None, episode_image_path=None):
         """Create the final MP4 video using frame generator for memory efficiency."""
         print(f"\n🎬 Creating video: {os.path.basename(output_path)}")
@@ -925,7 +1243,7 @@ class VideoGenerator:
             # Load and prepare logo
             logo = None
             if logo_path and os.path.exists(logo_path):
-                logo = self.load_and_prepare_logo(logo_path)
+                logo = self.get_prepared_logo(logo_path)
             
             # Load and prepare episode-specific image (optional)
             episode_image = None
@@ -937,27 +1255,25 @@ class VideoGenerator:
             # Note: text_overlay will be created dynamically per frame for fade-in and glow pulse effects
             print("✓ Text overlay will be generated dynamically for animations")
             
-            # Load audio to get duration
-            audio_clip = AudioFileClip(audio_path)
-            duration = audio_clip.duration
+            # Read the audio duration from the file header
+            duration = sf.info(audio_path).duration
             
             print(f"🎨 Creating video frames on-demand (Duration: {duration:.1f}s)...")
             if fullscreen_image:
                 print(f"📸 Thematic image transitions: {self.initial_composite_duration}s composite → {self.fullscreen_image_duration}s fullscreen (repeating)")
             print("⚡ Performance optimizations: Static text (no glow pulse), static logo (no breathing)")
             
-            # Create a generator for final composited frames  
-            font_cache = None  # Will be populated on first frame to avoid re-searching
+            # Frame inputs are produced in order (waveform frames and the text fade-in
+            # are sequential); compositing each frame is independent and runs in parallel
+            total_frames = int(duration * self.fps)
+            fade_frames = int(2.0 * self.fps)  # 2-second fade
             
-            def final_frame_generator():
-                nonlocal font_cache
+            def frame_inputs():
                 frame_count = 0
-                total_frames = int(duration * self.fps)
                 last_percent = -1
                 font_cache = None  # Will be populated on first frame
                 static_text_overlay = None  # Cache for static text (performance optimization)
                 fade_duration = 2.0
-                fade_frames = int(fade_duration * self.fps)
                 
                 for waveform_frame, waveform_data in waveform_frame_generator:
                     time_position = frame_count / self.fps
@@ -987,101 +1303,37 @@ class VideoGenerator:
                         # After fade-in: reuse static overlay (major performance gain)
                         text_overlay = static_text_overlay
                     
-                    # Composite this frame with view state transitions
-                    final_frame = self.composite_frame(
-                        waveform_frame, logo, text_overlay, time_position, duration, episode_image, fullscreen_image, waveform_data
-                    )
-                    
-                    # Apply fade if needed
-                    fade_frames = int(2.0 * self.fps)  # 2-second fade
-                    
-                    alpha = 1.0
-                    if frame_count < fade_frames:
-                        alpha = frame_count / fade_frames
-                    elif frame_count > total_frames - fade_frames:
-                        alpha = (total_frames - frame_count) / fade_frames
-                    
-                    if alpha < 1.0:
-                        final_frame = (final_frame * alpha).astype(np.uint8)
-                    
+                    yield frame_count, waveform_frame, waveform_data, text_overlay
                     frame_count += 1
-                    yield final_frame
-            
-            # Create video clip using frame generator
-            def make_frame(t):
-                frame_idx = int(t * self.fps)
-                # We need to create a list to store frames as we generate them
-                # This is still memory efficient as we only keep what we need
-                if not hasattr(make_frame, 'frame_cache'):
-                    make_frame.frame_cache = {}
-                    make_frame.generator = final_frame_generator()
-                    make_frame.last_idx = -1
+            
+            def render_frame(inputs):
+                frame_count, waveform_frame, waveform_data, text_overlay = inputs
+                time_position = frame_count / self.fps
                 
-                # Generate frames up to the requested index
-                while make_frame.last_idx < frame_idx:
-                    try:
-                        next_frame = next(make_frame.generator)
-                        make_frame.last_idx += 1
-                        make_frame.frame_cache[make_frame.last_idx] = next_frame
-                        
-                        # Keep only recent frames to save memory
-                        if len(make_frame.frame_cache) > 100:
-                            oldest_key = min(make_frame.frame_cache.keys())
-                            del make_frame.frame_cache[oldest_key]
-                            
-                    except StopIteration:
-                        break
+                # Composite this frame with view state transitions
+                final_frame = self.composite_frame(
+                    waveform_frame, logo, text_overlay, time_position, duration, episode_image, fullscreen_image, waveform_data
+                )
                 
-                # Return the requested frame
-                if frame_idx in make_frame.frame_cache:
-                    return make_frame.frame_cache[frame_idx]
-                else:
-                    # Return the last available frame if requested frame is beyond end
-                    last_available = max(make_frame.frame_cache.keys()) if make_frame.frame_cache else 0
-                    return make_frame.frame_cache.get(last_available, np.zeros((self.height, self.width, 3), dtype=np.uint8))
-            
-            video_clip = VideoClip(make_frame, duration=duration)
-            # Explicitly set video size to prevent scaling issues
-            video_clip.size = (self.width, self.height)
-            
-            # Combine video and audio (compatible with moviepy 1.x and 2.x)
-            if hasattr(video_clip, 'set_audio'):
-                # moviepy 1.x
-                final_clip = video_clip.set_audio(audio_clip)
-            else:
-                # moviepy 2.x
-                video_clip.audio = audio_clip
-                final_clip = video_clip
+                # Apply fade if needed
+                alpha = 1.0
+                if frame_count < fade_frames:
+                    alpha = frame_count / fade_frames
+                elif frame_count > total_frames - fade_frames:
+                    alpha = (total_frames - frame_count) / fade_frames
+                
+                if alpha < 1.0:
+                    final_frame = cv2.LUT(final_frame, self._fade_lut(alpha))
+                
+                return final_frame
             
             # Write final video with optimized settings
             print(f"💾 Saving video to: {output_path}")
             print(f"📐 Video resolution: {self.width}x{self.height} @ {self.fps}fps")
             
-            # Build write_videofile parameters (compatible with moviepy 1.x and 2.x)
-            write_params = {
-                'fps': self.fps,
-                'codec': 'libx264',
-                'audio_codec': 'aac',
-                'temp_audiofile': 'temp-audio.m4a',
-                'remove_temp': True,
-                'preset': 'medium',  # Balance between speed and file size
-                'ffmpeg_params': [
-                    '-crf', '23',  # Good quality with reasonable file size
-                    '-pix_fmt', 'yuv420p'  # Ensure consistent pixel format for compatibility
-                ]
-            }
-            
-            # Add verbose and logger only for moviepy 1.x
-            if hasattr(video_clip, 'set_audio'):
-                write_params['verbose'] = False
-                write_params['logger'] = None
-            
-            final_clip.write_videofile(output_path, **write_params)
-            
-            # Clean up
-            final_clip.close()
-            audio_clip.close()
-            video_clip.close()
+            # Frames are rendered ahead in background threads while FFmpeg encodes
+            frames = self.map_frames(render_frame, frame_inputs())
+            self.write_video(self.prefetch_frames(frames), audio_path, output_path)
             
             print("✅ Video creation complete!")
             return True
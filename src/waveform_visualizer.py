@@ -2,17 +2,24 @@ import numpy as np
 import librosa
 import cv2
 import hashlib
-import pickle
 import os
+import re
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
+from scipy import signal
+
+# Cache file names after the audio stem: legacy pickle or versioned, hash-addressed .npy
+_CACHE_NAME_SUFFIX_RE = re.compile(r'_waveform(?:\.pkl|_v\d+_[0-9a-f]{32}\.npy(?:\.tmp)?)')
 
 
 class WaveformVisualizer:
     """Creates waveform visualizations with beige color scheme."""
     
+    # Bump when the layout or meaning of cached waveform analysis changes
+    CACHE_VERSION = 2
+    
     def __init__(self, width=1920, height=1080):
         self.width = width
         self.height = height
@@ -50,29 +57,76 @@ class WaveformVisualizer:
             return np.zeros(self.history_width)
         
         samples_per_pixel = max(1, len(window_audio) // self.history_width)
-        downsampled = []
-        for i in range(0, len(window_audio), samples_per_pixel):
-            chunk = window_audio[i:i + samples_per_pixel]
-            if len(chunk) > 0:
-                # Use RMS for volume representation
-                rms_value = np.sqrt(np.mean(chunk**2))
-                avg_value = np.mean(chunk)
-                # Create spiky brainwave pattern
-                combined = avg_value * (0.3 + 5.5 * rms_value)
-                spike_variation = np.random.normal(0, 0.35) * rms_value
-                combined += spike_variation
-                # Add frequent sharp spikes
-                if np.random.random() < 0.25:
-                    combined *= np.random.uniform(1.8, 3.2)
-                downsampled.append(combined)
-        
-        # Pad or trim to exact width
-        if len(downsampled) < self.history_width:
-            downsampled.extend([0] * (self.history_width - len(downsampled)))
-        else:
-            downsampled = downsampled[:self.history_width]
         
-        return np.array(downsampled)
+        # Per-pixel sums over consecutive chunks in one vectorized pass
+        # (chunks past the display width would be trimmed anyway, so skip them)
+        window_audio = window_audio[:samples_per_pixel * self.history_width]
+        chunk_starts = np.arange(0, len(window_audio), samples_per_pixel)
+        chunk_lengths = np.diff(chunk_starts, append=len(window_audio))
+        sums = np.add.reduceat(window_audio, chunk_starts)
+        sums_sq = np.add.reduceat(window_audio * window_audio, chunk_starts)
+        
+        # Use RMS for volume representation
+        rms_value = np.sqrt(sums_sq / chunk_lengths)
+        avg_value = sums / chunk_lengths
+        # Create spiky brainwave pattern
+        combined = avg_value * (0.3 + 5.5 * rms_value)
+        combined += np.random.normal(0, 0.35, len(combined)) * rms_value
+        # Add frequent sharp spikes
+        spikes = np.random.random(len(combined)) < 0.25
+        combined[spikes] *= np.random.uniform(1.8, 3.2, np.count_nonzero(spikes))
+        
+        # Pad to exact width
+        downsampled = np.zeros(self.history_width)
+        downsampled[:len(combined)] = combined
+        return downsampled
+    
+    def analyze_audio_frames(self, audio, sr, start_times, window_duration=3.0):
+        """Vectorized analyze_audio_frame for many frames at once.
+        
+        Chunk sums come from cumulative sums over the audio spanned by the frames,
+        so each frame costs O(width) instead of O(window samples).
+        
+        Returns:
+            Array of shape (len(start_times), history_width)
+        """
+        width = self.history_width
+        num_frames = len(start_times)
+        if num_frames == 0:
+            return np.zeros((0, width), dtype=np.float32)
+        
+        # Same sample arithmetic as analyze_audio_frame, per frame
+        starts = np.minimum((start_times * sr).astype(np.int64), len(audio))
+        ends = np.minimum(starts + int(window_duration * sr), len(audio))
+        samples_per_pixel = np.maximum(1, (ends - starts) // width)
+        limits = np.minimum(ends, starts + samples_per_pixel * width)
+        bounds = np.minimum(starts[:, None] + np.arange(width + 1) * samples_per_pixel[:, None],
+                            limits[:, None])
+        
+        # Cumulative sums (float64 for accuracy) over just the audio these frames cover
+        segment_start = starts.min()
+        segment = audio[segment_start:limits.max()].astype(np.float64)
+        cumsum = np.concatenate(([0.0], np.cumsum(segment)))
+        cumsum_sq = np.concatenate(([0.0], np.cumsum(segment * segment)))
+        bounds -= segment_start
+        
+        chunk_lengths = np.diff(bounds, axis=1)
+        has_samples = chunk_lengths > 0
+        safe_lengths = np.where(has_samples, chunk_lengths, 1)
+        sums = np.diff(cumsum[bounds], axis=1)
+        sums_sq = np.maximum(np.diff(cumsum_sq[bounds], axis=1), 0.0)
+        
+        # Use RMS for volume representation (empty chunks are padding and stay zero)
+        rms_value = np.sqrt(sums_sq / safe_lengths) * has_samples
+        avg_value = sums / safe_lengths
+        # Create spiky brainwave pattern
+        combined = avg_value * (0.3 + 5.5 * rms_value)
+        combined += np.random.normal(0, 0.35, combined.shape) * rms_value
+        # Add frequent sharp spikes
+        spikes = np.random.random(combined.shape) < 0.25
+        combined[spikes] *= np.random.uniform(1.8, 3.2, np.count_nonzero(spikes))
+        
+        return combined.astype(np.float32)
     
     def create_waveform_frame(self, waveform_data, time_position, total_duration):
         """Create a single frame of the waveform visualization."""
@@ -159,55 +213,72 @@ class WaveformVisualizer:
         if not audio_path.exists():
             return None
         
-        # Use file size and modification time for quick hash
+        # Use file size and modification time for quick hash (no need to read the file)
         stat = audio_path.stat()
-        hash_string = f"{audio_path.name}_{stat.st_size}_{stat.st_mtime}"
-        return hashlib.md5(hash_string.encode()).hexdigest()
+        digest = hashlib.blake2b(f"{audio_path.name}_{stat.st_size}_{stat.st_mtime_ns}".encode(), digest_size=16)
+        if stat.st_mtime_ns <= 0:
+            # Unusable timestamp (e.g. reset by an archive tool): fall back to the contents
+            with open(audio_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+        return digest.hexdigest()
     
-    def get_cache_path(self, audio_path):
-        """Get the cache file path for waveform analysis data."""
+    def get_cache_path(self, audio_path, audio_hash):
+        """Get the cache file path for waveform analysis data.
+        
+        The file name includes the cache version and the audio hash, so a
+        matching file is always valid and stale entries simply stop matching.
+        """
         audio_path = Path(audio_path)
         cache_dir = audio_path.parent / ".waveform_cache"
         cache_dir.mkdir(exist_ok=True)
-        return cache_dir / f"{audio_path.stem}_waveform.pkl"
+        return cache_dir / f"{audio_path.stem}_waveform_v{self.CACHE_VERSION}_{audio_hash}.npy"
     
     def save_waveform_cache(self, audio_path, waveform_cache, audio_hash):
-        """Save waveform analysis data to cache."""
-        cache_path = self.get_cache_path(audio_path)
-        cache_data = {
-            'audio_hash': audio_hash,
-            'waveform_cache': waveform_cache,
-            'cache_version': '1.0'  # For future compatibility
-        }
+        """Save waveform analysis data (a frames x width array) to cache."""
+        cache_path = self.get_cache_path(audio_path, audio_hash)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
         try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(cache_data, f)
+            # Write via a temporary file so readers never see a partial array
+            with open(tmp_path, 'wb') as f:
+                np.save(f, waveform_cache)
+            os.replace(tmp_path, cache_path)
+            self._remove_stale_caches(cache_path, Path(audio_path).stem)
             print(f"  ✓ Waveform analysis cached to: {cache_path.name}")
         except Exception as e:
             print(f"  ⚠ Warning: Could not save waveform cache: {e}")
     
-    def load_waveform_cache(self, audio_path):
-        """Load waveform analysis data from cache if available and valid."""
-        cache_path = self.get_cache_path(audio_path)
+    @staticmethod
+    def _remove_stale_caches(current_path, stem):
+        """Delete older cache files for the same audio file (previous versions or hashes)."""
+        with os.scandir(current_path.parent) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name != current_path.name and name.startswith(stem)
+                        and _CACHE_NAME_SUFFIX_RE.fullmatch(name, len(stem))):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+    
+    def load_waveform_cache(self, audio_path, audio_hash):
+        """Load waveform analysis data from cache if available and valid.
+        
+        The array is memory-mapped, so frames are paged in as they are rendered
+        instead of the whole analysis being read into RAM up front.
+        """
+        cache_path = self.get_cache_path(audio_path, audio_hash)
         if not cache_path.exists():
             return None
         
         try:
-            with open(cache_path, 'rb') as f:
-                cache_data = pickle.load(f)
-            
-            # Validate cache version and audio hash
-            if cache_data.get('cache_version') != '1.0':
-                print(f"  ⚠ Cache version mismatch, regenerating analysis...")
-                return None
-            
-            current_hash = self.get_audio_hash(audio_path)
-            if cache_data.get('audio_hash') != current_hash:
-                print(f"  ⚠ Audio file changed, regenerating analysis...")
+            waveform_cache = np.load(cache_path, mmap_mode='r')
+            if waveform_cache.ndim != 2 or waveform_cache.shape[1] != self.history_width:
+                print(f"  ⚠ Cache shape mismatch, regenerating analysis...")
                 return None
             
             print(f"  ✓ Using cached waveform analysis from: {cache_path.name}")
-            return cache_data['waveform_cache']
+            return waveform_cache
         
         except Exception as e:
             print(f"  ⚠ Warning: Could not load waveform cache: {e}")
@@ -221,8 +292,15 @@ class WaveformVisualizer:
         return (smoothing_factor * previous_data + 
                 (1 - smoothing_factor) * current_data)
     
-    def generate_waveform_frames(self, audio_path, total_duration):
-        """Generate waveform frames on-demand with caching support."""
+    def generate_waveform_frames(self, audio_path, total_duration, audio=None, sr=None):
+        """Generate waveform frames on-demand with caching support.
+        
+        Args:
+            audio_path: Path to the audio file (also the cache key)
+            total_duration: Duration of the audio in seconds
+            audio, sr: Optional samples and sample rate already in memory for this file;
+                       when given, the file is not decoded again on a cache miss
+        """
         frame_count = int(total_duration * self.fps)
         frame_duration = 1.0 / self.fps
         
@@ -233,29 +311,43 @@ class WaveformVisualizer:
         cached_waveform_data = None
         
         if audio_hash:
-            cached_waveform_data = self.load_waveform_cache(audio_path)
+            cached_waveform_data = self.load_waveform_cache(audio_path, audio_hash)
         
         # Use cached data or generate new analysis
         if cached_waveform_data is not None:
             print("  ✓ Using cached waveform analysis data")
             waveform_cache = cached_waveform_data
         else:
-            print("  🎵 Loading audio for fresh waveform analysis...")
-            audio, sr = librosa.load(audio_path, sr=22050)
+            if audio is not None:
+                print("  🎵 Using in-memory audio for fresh waveform analysis...")
+                if sr != 22050:
+                    audio = librosa.resample(audio, orig_sr=sr, target_sr=22050)
+                sr = 22050
+            else:
+                print("  🎵 Loading audio for fresh waveform analysis...")
+                audio, sr = librosa.load(audio_path, sr=22050)
             
             print("  📊 Computing waveform analysis...")
-            waveform_cache = []
-            previous_data = None
+            # One row per frame; float32 is ample for pixel offsets and halves the cache size
+            waveform_cache = np.empty((frame_count, self.history_width), dtype=np.float32)
+            start_times = np.arange(frame_count) * frame_duration
+            smoothing_factor = 0.8
+            smoothing_state = None
             
-            for frame_idx in range(frame_count):
-                if frame_idx % 500 == 0:
-                    print(f"    Waveform analysis: {frame_idx}/{frame_count} frames ({frame_idx/frame_count*100:.1f}%)")
+            # Analyze frames in blocks (bounded temporaries) rather than one at a time
+            block_size = 500
+            for block_start in range(0, frame_count, block_size):
+                print(f"    Waveform analysis: {block_start}/{frame_count} frames ({block_start/frame_count*100:.1f}%)")
+                block_end = min(block_start + block_size, frame_count)
+                block = self.analyze_audio_frames(audio, sr, start_times[block_start:block_end])
                 
-                time_position = frame_idx * frame_duration
-                waveform_data = self.analyze_audio_frame(audio, sr, time_position)
-                waveform_data = self.smooth_waveform_data(waveform_data, previous_data)
-                previous_data = waveform_data.copy()
-                waveform_cache.append(waveform_data)
+                # Temporal smoothing (as in smooth_waveform_data) is a first-order recursive
+                # filter along the frame axis; the first frame is used unsmoothed
+                if smoothing_state is None:
+                    smoothing_state = smoothing_factor * block[:1]
+                waveform_cache[block_start:block_end], smoothing_state = signal.lfilter(
+                    [1 - smoothing_factor], [1, -smoothing_factor], block, axis=0, zi=smoothing_state
+                )
             
             # Save to cache if we have a valid hash
             if audio_hash:
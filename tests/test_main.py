@@ -0,0 +1,183 @@
+"""Unit tests for the batch bookkeeping in main.py (no audio or video processing).
+
+Run with: python -m unittest discover tests
+"""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import main
+from main import PodcastVideoConverter, parse_selection
+
+
+class ParseSelectionTests(unittest.TestCase):
+    def test_numbers_and_ranges(self):
+        self.assertEqual(parse_selection("1,3-5", 6), [0, 2, 3, 4])
+
+    def test_whitespace_is_allowed(self):
+        self.assertEqual(parse_selection(" 2 , 4 - 5 ", 6), [1, 3, 4])
+
+    def test_reversed_range_selects_the_same_files(self):
+        self.assertEqual(parse_selection("5-3", 6), [2, 3, 4])
+
+    def test_out_of_range_numbers_are_ignored(self):
+        self.assertEqual(parse_selection("0,2,9", 6), [1])
+        self.assertEqual(parse_selection("4-99", 6), [3, 4, 5])
+        self.assertEqual(parse_selection("7-9", 6), [])
+
+    def test_each_file_is_kept_once_in_order(self):
+        self.assertEqual(parse_selection("3,1-3,1", 6), [2, 0, 1])
+
+    def test_malformed_selection(self):
+        for selection in ("", "a", "1,,2", "1-", "-2", "1;2"):
+            with self.subTest(selection=selection):
+                self.assertIsNone(parse_selection(selection, 6))
+
+
+class ConverterTestCase(unittest.TestCase):
+    """Runs each test against a converter whose directories are in a temporary folder."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        env = {
+            'PODCAST_INPUT_DIR': str(root / "input"),
+            'PODCAST_OUTPUT_DIR': str(root / "output"),
+            'PODCAST_ASSETS_DIR': str(root / "assets"),
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.converter = self.make_converter()
+
+    def make_converter(self, **kwargs):
+        with redirect_stdout(io.StringIO()):
+            converter = PodcastVideoConverter(**kwargs)
+        converter.episode_titles = {}
+        return converter
+
+    def write_input(self, name, data):
+        path = self.converter.input_dir / name
+        path.write_bytes(data)
+        return path
+
+
+class StampTests(ConverterTestCase):
+    def setUp(self):
+        super().setUp()
+        self.audio = self.write_input("episode.wav", b"RIFF" + bytes(100))
+        self.video, self.processed_audio = self.converter.get_output_paths(self.audio)
+
+    def render(self, converter=None, title="Episode"):
+        """Pretend to render the episode: write its outputs and their stamp."""
+        converter = converter or self.converter
+        self.video.write_bytes(b"video")
+        self.processed_audio.write_bytes(b"audio")
+        converter.save_stamp(self.video, converter.build_stamp(self.audio, title))
+
+    def is_up_to_date(self, converter=None, title="Episode"):
+        converter = converter or self.make_converter()
+        return converter.is_up_to_date(self.video, self.processed_audio, converter.build_stamp(self.audio, title))
+
+    def test_round_trip(self):
+        self.render()
+        self.assertTrue(self.is_up_to_date())
+
+    def test_missing_outputs_or_stamp(self):
+        for path in (self.video, self.processed_audio, self.converter.get_stamp_path(self.video)):
+            with self.subTest(missing=path.name):
+                self.render()
+                path.unlink()
+                self.assertFalse(self.is_up_to_date())
+
+    def test_changed_title(self):
+        self.render()
+        self.assertFalse(self.is_up_to_date(title="Another title"))
+
+    def test_changed_audio(self):
+        self.render()
+        self.audio.write_bytes(b"RIFF" + bytes(200))
+        self.assertFalse(self.is_up_to_date())
+
+    def test_changed_settings(self):
+        self.render()
+        for settings in ({'enhance_audio': True}, {'preset': 'veryfast'}, {'encoder': 'h264_qsv'}):
+            with self.subTest(**settings):
+                self.assertFalse(self.is_up_to_date(self.make_converter(**settings)))
+
+    def test_added_episode_image(self):
+        self.render()
+        self.write_input("episode.png", b"image")
+        self.assertFalse(self.is_up_to_date())
+
+    def test_corrupt_stamp(self):
+        self.render()
+        self.converter.get_stamp_path(self.video).write_text("{not json")
+        self.assertFalse(self.is_up_to_date())
+
+
+class DuplicateTests(ConverterTestCase):
+    def test_identical_files_are_grouped(self):
+        first = self.write_input("a.wav", b"same audio")
+        copy = self.write_input("b.wav", b"same audio")
+        other = self.write_input("c.wav", b"diff audio")
+        self.converter.episode_titles = {"a": "Title", "b": "Title", "c": "Title"}
+        self.assertEqual(self.converter.find_duplicate_files([first, copy, other]), {first: [copy]})
+
+    def test_title_and_image_must_match(self):
+        first = self.write_input("a.wav", b"same audio")
+        retitled = self.write_input("b.wav", b"same audio")
+        with_image = self.write_input("c.wav", b"same audio")
+        self.write_input("c.png", b"image")
+        self.converter.episode_titles = {"a": "Title", "b": "Other title", "c": "Title"}
+        self.assertEqual(self.converter.find_duplicate_files([first, retitled, with_image]), {})
+
+    def test_unmatched_files_are_not_hashed(self):
+        first = self.write_input("a.wav", b"short")
+        second = self.write_input("b.wav", b"longer audio")
+        with mock.patch.object(PodcastVideoConverter, '_content_hash') as content_hash:
+            self.assertEqual(self.converter.find_duplicate_files([first, second]), {})
+        content_hash.assert_not_called()
+
+
+class EnvironmentFallbackTests(unittest.TestCase):
+    def call_quietly(self, function, env):
+        output = io.StringIO()
+        with mock.patch.dict(os.environ, env), redirect_stdout(output):
+            return function(), output.getvalue()
+
+    def test_jobs(self):
+        self.assertEqual(self.call_quietly(main._default_jobs, {'PODCAST_JOBS': '3'}), (3, ''))
+        jobs, output = self.call_quietly(main._default_jobs, {'PODCAST_JOBS': 'four'})
+        self.assertEqual(jobs, 1)
+        self.assertIn("PODCAST_JOBS", output)
+
+    def test_encoder(self):
+        self.assertEqual(self.call_quietly(main._default_encoder, {'PODCAST_ENCODER': 'auto'}), ('auto', ''))
+        encoder, output = self.call_quietly(main._default_encoder, {'PODCAST_ENCODER': 'nvenc'})
+        self.assertEqual(encoder, 'libx264')
+        self.assertIn("PODCAST_ENCODER", output)
+
+    def test_large_file_threshold(self):
+        with tempfile.TemporaryDirectory() as root:
+            dirs = {name: os.path.join(root, name) for name in
+                    ('PODCAST_INPUT_DIR', 'PODCAST_OUTPUT_DIR', 'PODCAST_ASSETS_DIR')}
+            converter, _ = self.call_quietly(PodcastVideoConverter, {**dirs, 'PODCAST_LARGE_MB': '250'})
+            self.assertEqual(converter.large_file_mb, 250)
+            converter, output = self.call_quietly(PodcastVideoConverter, {**dirs, 'PODCAST_LARGE_MB': 'big'})
+            self.assertEqual(converter.large_file_mb, 100)
+            self.assertIn("PODCAST_LARGE_MB", output)
+
+
+if __name__ == "__main__":
+    unittest.main()